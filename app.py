@@ -1,54 +1,164 @@
+import atexit
 import os
+import re
+import gzip
+import hashlib
+import hmac
+import importlib.util
 import sys
 import json
+import mimetypes
+import queue
 import subprocess
-import traceback
+import threading
+import time
+import uuid
+from datetime import datetime
 from pathlib import Path
-from flask import Flask, request, jsonify, render_template_string, render_template, send_from_directory, redirect, url_for
+from urllib.parse import quote, unquote
+from flask import Flask, Request, Response, request, jsonify, render_template, send_from_directory, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.security import safe_join
+from werkzeug.utils import secure_filename
 import logging
-from celery_app import celery_app, process_video_task, cleanup_task, auto_cleanup_task
+from logging.handlers import QueueHandler, QueueListener
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: chunk bookkeeping runs without a file lock
 
-# Add the project root to Python path
+from config.paths import get_config_paths
+
+# Imported as a top-level module (gunicorn app:app, dev_start.py), so the project root is
+# already on sys.path
 project_root = Path(__file__).parent.absolute()
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson, falling back to Flask's default for other types"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype
+        )
 
 app = Flask(__name__)
+# orjson is optional; without it jsonify() keeps using the stdlib encoder
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+# Reject oversized uploads before they are read (matches client_max_body_size in the nginx config)
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_UPLOAD_MB', 500)) * 1024 * 1024
+
+# Copy uploads to disk in 1 MiB chunks instead of werkzeug's 16 KiB default
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Video formats the pipeline accepts (same list as the upload form and run_pipeline)
+ALLOWED_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv'}
+
+# Chunked uploads: "Content-Range: bytes start-end/total" plus a client-chosen upload id
+CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-(\d+)/(\d+)')
+UPLOAD_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,64}')
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging: request threads only enqueue records, a listener thread writes them to stderr
+# (QueueHandler formats the record, so the listener's handler keeps the plain default formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)], force=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-def clear_pipeline_logs():
-    """Clear pipeline logs before processing a new video"""
-    try:
-        log_file = Path('pipeline.log')
-        if log_file.exists():
-            log_file.unlink()
-            logger.info("🗑️ Cleared previous pipeline logs")
-    except Exception as e:
-        logger.warning(f"⚠️ Could not clear logs: {str(e)}")
+# Nginx `internal` location aliased to the output folder (e.g. /internal/output/).
+# When set, /output/<file> only emits an X-Accel-Redirect header and nginx streams the video.
+X_ACCEL_REDIRECT_PREFIX = os.environ.get('X_ACCEL_REDIRECT_PREFIX')
 
-def get_config_paths():
-    """Get input and output paths from config file"""
-    try:
-        config_path = Path(__file__).parent / "config" / "master_config.json"
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        input_folder = config.get('input_folder', './input')
-        output_folder = config.get('output_folder', './output')
-        
-        # Use Hostinger KVM 2 paths
-        input_folder = '/opt/video-automation/input'
-        output_folder = '/opt/video-automation/output'
-        logger.info("🖥️ Running on Hostinger KVM 2 - using Hostinger paths")
+# Behind Apache with mod_xsendfile, send_from_directory() emits an X-Sendfile header instead of the body
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
+# Browser cache lifetime for processed videos (same as `expires 1h` on nginx's /output/)
+OUTPUT_CACHE_MAX_AGE = 3600
+
+# Upper bound on how much of pipeline.log a single /logs or /result response carries
+LOG_TAIL_BYTES = 64 * 1024
+
+# Largest tail a client may ask for with ?bytes=
+LOG_TAIL_MAX_BYTES = 1024 * 1024
+
+def read_log_tail(log_file, offset=None, max_bytes=LOG_TAIL_BYTES):
+    """
+    Read the end of a log file without loading the whole file.
+    
+    Args:
+        log_file: Path to the log file
+        offset: Byte offset already seen by the client; only newer bytes are returned
+        max_bytes: Maximum number of bytes to return
         
-        return input_folder, output_folder
-    except Exception as e:
-        logger.warning(f"⚠️ Could not read config, using default paths: {str(e)}")
-        # Use Hostinger KVM 2 default paths
-        return '/opt/video-automation/input', '/opt/video-automation/output'
+    Returns:
+        Tuple of (decoded log text, offset of the end of the file)
+    """
+    with open(log_file, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        start = max(0, size - max_bytes)
+        # An offset past the end means the log was cleared since the last fetch
+        if offset is not None and offset <= size:
+            start = max(start, offset)
+        f.seek(start)
+        data = f.read(size - start)
+    return data.decode('utf-8', errors='replace'), size
+
+def requested_log_bytes():
+    """Log tail size from the ?bytes= query parameter, clamped to LOG_TAIL_MAX_BYTES"""
+    max_bytes = request.args.get('bytes', LOG_TAIL_BYTES, type=int)
+    return min(max(max_bytes, 0), LOG_TAIL_MAX_BYTES)
+
+# Resolved once at import; request handlers use these instead of re-reading the config
+INPUT_FOLDER, OUTPUT_FOLDER = get_config_paths()
+
+# Result of the `ffmpeg -version` probe; ffmpeg does not appear or vanish at runtime
+_FFMPEG_STATUS = None
+
+def get_ffmpeg_status():
+    """Return 'available', 'error' or 'not_found', probing ffmpeg only on the first call"""
+    global _FFMPEG_STATUS
+    if _FFMPEG_STATUS is None:
+        try:
+            result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=5)
+            _FFMPEG_STATUS = "available" if result.returncode == 0 else "error"
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            _FFMPEG_STATUS = "not_found"
+    return _FFMPEG_STATUS
+
+# Whether the openai package is importable; checked once like ffmpeg
+_OPENAI_AVAILABLE = None
+
+def get_openai_available():
+    """Return True if the openai package is installed, checking only on the first call"""
+    global _OPENAI_AVAILABLE
+    if _OPENAI_AVAILABLE is None:
+        # find_spec locates the package without importing it
+        _OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
+    return _OPENAI_AVAILABLE
+
+# Set once the input/output folders are known to exist, so requests skip the mkdir syscalls
+_DIRS_READY = False
+
+def ensure_directories():
+    """Create the input and output folders on first use"""
+    global _DIRS_READY
+    if not _DIRS_READY:
+        for dir_path in (INPUT_FOLDER, OUTPUT_FOLDER):
+            Path(dir_path).mkdir(parents=True, exist_ok=True)
+        _DIRS_READY = True
 
 def validate_environment():
     """Validate that required environment variables and dependencies are available"""
@@ -63,224 +173,326 @@ def validate_environment():
             missing_vars.append(var)
     
     if missing_vars:
-        logger.warning(f"⚠️ Missing environment variables: {missing_vars}")
+        logger.warning("⚠️ Missing environment variables: %s", missing_vars)
     
-    # Get paths from config
-    input_folder, output_folder = get_config_paths()
-    required_dirs = [input_folder, output_folder]
-    
-    for dir_path in required_dirs:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
-        logger.info(f"✅ Directory ready: {dir_path}")
+    ensure_directories()
+    logger.info("✅ Directories ready: %s, %s", INPUT_FOLDER, OUTPUT_FOLDER)
     
     # Check for ffmpeg availability
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            logger.info("✅ ffmpeg is available")
-        else:
-            logger.error("❌ ffmpeg not working properly")
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    ffmpeg_status = get_ffmpeg_status()
+    if ffmpeg_status == "available":
+        logger.info("✅ ffmpeg is available")
+    elif ffmpeg_status == "error":
+        logger.error("❌ ffmpeg not working properly")
+    else:
         logger.error("❌ ffmpeg not found - this will cause pipeline failures")
     
     # Check for Python dependencies
-    try:
-        import openai
+    if get_openai_available():
         logger.info("✅ OpenAI library available")
-    except ImportError:
+    else:
         logger.warning("⚠️ OpenAI library not found")
     
     logger.info("🔍 Environment validation complete")
 
-# HTML template for file upload with async processing
-UPLOAD_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Video Automation Pipeline</title>
-    <style>
-        body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
-        .upload-area { border: 2px dashed #ccc; padding: 40px; text-align: center; margin: 20px 0; }
-        .upload-area:hover { border-color: #999; }
-        button { background: #007bff; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; }
-        button:hover { background: #0056b3; }
-        button:disabled { background: #6c757d; cursor: not-allowed; }
-        .status { margin: 20px 0; padding: 10px; border-radius: 5px; }
-        .success { background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
-        .error { background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
-        .info { background: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb; }
-        .warning { background: #fff3cd; color: #856404; border: 1px solid #ffeaa7; }
-        .progress-bar { width: 100%; height: 20px; background-color: #f0f0f0; border-radius: 10px; overflow: hidden; margin: 10px 0; }
-        .progress-fill { height: 100%; background-color: #007bff; width: 0%; transition: width 0.3s ease; }
-        .spinner { border: 4px solid #f3f3f3; border-top: 4px solid #007bff; border-radius: 50%; width: 20px; height: 20px; animation: spin 1s linear infinite; display: inline-block; margin-right: 10px; }
-        @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-        .hidden { display: none; }
-        .task-info { background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 10px 0; }
-    </style>
-</head>
-<body>
-    <h1>🎬 Video Automation Pipeline</h1>
-    <p>Upload a video file to process it through the automation pipeline.</p>
-    
-    <form id="uploadForm" enctype="multipart/form-data">
-        <div class="upload-area">
-            <input type="file" name="file" accept=".mp4,.mov,.avi,.mkv" required>
-            <p>Select a video file (.mp4, .mov, .avi, .mkv)</p>
-        </div>
-        <button type="submit" id="submitBtn">🚀 Process Video</button>
-    </form>
-    
-    <div id="status"></div>
-    <div id="taskInfo" class="task-info hidden">
-        <h3>Task Information</h3>
-        <p><strong>Task ID:</strong> <span id="taskId"></span></p>
-        <p><strong>Status:</strong> <span id="taskStatus"></span></p>
-        <div class="progress-bar">
-            <div class="progress-fill" id="progressFill"></div>
-        </div>
-        <p id="progressText">Processing...</p>
-    </div>
-    
-    <script>
-        let currentTaskId = null;
-        let statusCheckInterval = null;
-        
-        document.getElementById('uploadForm').addEventListener('submit', async function(e) {
-            e.preventDefault();
-            
-            const formData = new FormData(this);
-            const statusDiv = document.getElementById('status');
-            const taskInfoDiv = document.getElementById('taskInfo');
-            const submitBtn = document.getElementById('submitBtn');
-            
-            // Disable form and show initial status
-            submitBtn.disabled = true;
-            submitBtn.textContent = '⏳ Uploading...';
-            statusDiv.innerHTML = '<div class="info">⏳ Uploading video file...</div>';
-            
-            try {
-                const response = await fetch('/upload', {
-                    method: 'POST',
-                    body: formData
-                });
-                
-                const result = await response.json();
-                
-                if (response.ok) {
-                    currentTaskId = result.task_id;
-                    statusDiv.innerHTML = '<div class="info">✅ Video uploaded successfully! Processing started.</div>';
-                    
-                    // Show task info
-                    document.getElementById('taskId').textContent = currentTaskId;
-                    document.getElementById('taskStatus').textContent = 'PROCESSING';
-                    taskInfoDiv.classList.remove('hidden');
-                    
-                    // Start status checking
-                    startStatusCheck();
-                } else {
-                    statusDiv.innerHTML = `<div class="error">❌ Upload failed: ${result.error || 'Unknown error'}</div>`;
-                    submitBtn.disabled = false;
-                    submitBtn.textContent = '🚀 Process Video';
-                }
-            } catch (error) {
-                statusDiv.innerHTML = `<div class="error">❌ Upload error: ${error.message}</div>`;
-                submitBtn.disabled = false;
-                submitBtn.textContent = '🚀 Process Video';
-            }
-        });
-        
-        function startStatusCheck() {
-            if (statusCheckInterval) {
-                clearInterval(statusCheckInterval);
-            }
-            
-            statusCheckInterval = setInterval(async () => {
-                if (!currentTaskId) return;
-                
-                try {
-                    const response = await fetch(`/task/${currentTaskId}`);
-                    const result = await response.json();
-                    
-                    if (response.ok) {
-                        updateTaskStatus(result);
-                        
-                        if (result.state === 'SUCCESS' || result.state === 'FAILURE') {
-                            clearInterval(statusCheckInterval);
-                            handleTaskCompletion(result);
-                        }
-                    }
-                } catch (error) {
-                    console.error('Error checking task status:', error);
-                }
-            }, 2000); // Check every 2 seconds
-        }
-        
-        function updateTaskStatus(result) {
-            const statusSpan = document.getElementById('taskStatus');
-            const progressText = document.getElementById('progressText');
-            const progressFill = document.getElementById('progressFill');
-            
-            statusSpan.textContent = result.state;
-            
-            // Format ETA display
-            let etaDisplay = '';
-            if (result.eta_minutes !== null && result.eta_minutes !== undefined) {
-                if (result.eta_minutes === 0) {
-                    etaDisplay = ' - Completed!';
-                } else if (result.eta_minutes === 1) {
-                    etaDisplay = ' - ETA: ~1 minute';
-                } else {
-                    etaDisplay = ` - ETA: ~${Math.round(result.eta_minutes)} minutes`;
-                }
-            }
-            
-            if (result.state === 'PENDING') {
-                progressText.innerHTML = `<span class="spinner"></span>Task is waiting to be processed...${etaDisplay}`;
-                progressFill.style.width = '10%';
-            } else if (result.state === 'PROGRESS') {
-                progressText.innerHTML = `<span class="spinner"></span>${result.status || 'Processing...'}${etaDisplay}`;
-                progressFill.style.width = '50%';
-            } else if (result.state === 'SUCCESS') {
-                progressText.textContent = '✅ Task completed successfully!';
-                progressFill.style.width = '100%';
-                progressFill.style.backgroundColor = '#28a745';
-            } else if (result.state === 'FAILURE') {
-                progressText.textContent = '❌ Task failed';
-                progressFill.style.width = '100%';
-                progressFill.style.backgroundColor = '#dc3545';
-            }
-        }
-        
-        function handleTaskCompletion(result) {
-            const statusDiv = document.getElementById('status');
-            const submitBtn = document.getElementById('submitBtn');
-            
-            console.log('🔍 Task completion result:', result);
-            console.log('🔍 Current task ID:', currentTaskId);
-            
-            if (result.state === 'SUCCESS') {
-                statusDiv.innerHTML = '<div class="success">✅ Video processed successfully! Redirecting to result page...</div>';
-                console.log('🔍 Redirecting to:', `/task/${currentTaskId}/result`);
-                setTimeout(() => {
-                    window.location.href = `/task/${currentTaskId}/result`;
-                }, 2000);
-            } else {
-                statusDiv.innerHTML = `<div class="error">❌ Processing failed: ${result.error || 'Unknown error'}</div>`;
-            }
-            
-            // Re-enable form
-            submitBtn.disabled = false;
-            submitBtn.textContent = '🚀 Process Video';
-        }
-    </script>
-</body>
-</html>
-"""
+class UploadRequest(Request):
+    """Request that spools multipart file uploads into the input folder instead of /tmp"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        ensure_directories()
+        path = Path(INPUT_FOLDER) / f".incoming.{uuid.uuid4().hex}.part"
+        if not hasattr(self, 'incoming_paths'):
+            self.incoming_paths = []
+        self.incoming_paths.append(path)
+        return open(path, 'w+b', buffering=UPLOAD_BUFFER_SIZE)
+
+app.request_class = UploadRequest
+
+@app.teardown_request
+def remove_incoming_uploads(exc=None):
+    """Delete spooled upload files that weren't moved into place by the handler"""
+    for path in getattr(request, 'incoming_paths', ()):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("⚠️ Could not remove incoming upload %s: %s", path, e)
+
+@app.errorhandler(413)
+def upload_too_large(e):
+    """Return a JSON error the upload page can display when MAX_CONTENT_LENGTH is exceeded"""
+    max_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return jsonify({'error': f'File too large (max {max_mb} MB)'}), 413
+
+# The upload page has no template variables, so it is read once and served as bytes
+UPLOAD_PAGE_BYTES = (project_root / 'templates' / 'upload.html').read_bytes()
+UPLOAD_PAGE_GZIP = gzip.compress(UPLOAD_PAGE_BYTES, 9)
+UPLOAD_PAGE_ETAG = hashlib.md5(UPLOAD_PAGE_BYTES).hexdigest()
+UPLOAD_PAGE_MAX_AGE = 300
+
+# Dynamic responses smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+
+def accepts_gzip():
+    """True if the client sent Accept-Encoding: gzip"""
+    return bool(request.accept_encodings['gzip'])
+
+def gzip_response(response, level=6):
+    """
+    Gzip a buffered 200 response in place when the client accepts it and the body is large enough.
+    
+    A compressed response's ETag gets a "-gzip" suffix, since each encoding needs its own validator.
+    """
+    response.vary.add('Accept-Encoding')
+    if response.status_code == 200 and not response.is_streamed and accepts_gzip():
+        data = response.get_data()
+        if len(data) >= GZIP_MIN_BYTES:
+            response.set_data(gzip.compress(data, level))
+            response.headers['Content-Encoding'] = 'gzip'
+            etag, weak = response.get_etag()
+            if etag:
+                response.set_etag(f"{etag}-gzip", weak)
+    return response
 
 @app.route('/')
 def index():
     """Main page with file upload form"""
-    return render_template_string(UPLOAD_TEMPLATE)
+    if accepts_gzip():
+        response = Response(UPLOAD_PAGE_GZIP, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        # Each encoding needs its own validator
+        response.set_etag(f"{UPLOAD_PAGE_ETAG}-gzip")
+    else:
+        response = Response(UPLOAD_PAGE_BYTES, mimetype='text/html')
+        response.set_etag(UPLOAD_PAGE_ETAG)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = UPLOAD_PAGE_MAX_AGE
+    # Answers If-None-Match with an empty 304
+    return response.make_conditional(request)
+
+def resolve_upload_name(client_filename):
+    """
+    Turn a client-supplied filename into a safe name inside the input folder.
+    
+    Args:
+        client_filename: Filename sent by the browser
+        
+    Returns:
+        Tuple of (safe filename, error message); the error is None when the name is usable
+    """
+    # Reject unsupported files before anything is written to disk
+    extension = Path(client_filename).suffix.lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        return None, f'Unsupported file type: {extension or "none"}'
+    
+    # Strip path components and unsafe characters from the client-supplied name
+    return (secure_filename(Path(client_filename).stem) or 'upload') + extension, None
+
+def start_processing(filename):
+    """Queue the Celery task for an uploaded file and build the 202 response"""
+    from celery_app import process_video_task, VIDEO_TASK_EXPIRES
+    
+    task = process_video_task.apply_async(args=[filename], expires=VIDEO_TASK_EXPIRES)
+    
+    # Return task ID for status tracking
+    return jsonify({
+        'message': 'Video upload successful! Processing started.',
+        'task_id': task.id,
+        'status': 'PROCESSING',
+        'filename': filename
+    }), 202
+
+def copy_request_body(f):
+    """
+    Copy the raw request body into an open file in fixed-size chunks.
+    
+    Args:
+        f: Binary file object positioned where the body should be written
+        
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    while True:
+        chunk = request.stream.read(UPLOAD_BUFFER_SIZE)
+        if not chunk:
+            break
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+def merge_ranges(ranges):
+    """
+    Merge inclusive byte ranges into sorted, non-overlapping intervals.
+    
+    Args:
+        ranges: Iterable of [start, end] pairs (end inclusive)
+        
+    Returns:
+        List of [start, end] pairs, with overlapping and adjacent ranges joined
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+def save_upload_chunk(input_dir, filename, upload_id, content_range):
+    """
+    Write one chunk of a chunked upload and start processing once every byte has arrived.
+    
+    Chunks may arrive out of order and in parallel. Each one is written at its offset in a
+    shared .part file, and the byte ranges received so far are recorded in a .meta.json
+    sidecar that is updated under an exclusive lock.
+    
+    Args:
+        input_dir: Input folder the finished video is moved into
+        filename: Safe filename of the video
+        upload_id: Client-generated id that keeps concurrent uploads of the same name apart
+        content_range: Value of the Content-Range header ("bytes start-end/total")
+        
+    Returns:
+        Flask response tuple
+    """
+    match = CONTENT_RANGE_RE.fullmatch(content_range.strip())
+    if not match:
+        return jsonify({'error': f'Invalid Content-Range: {content_range}'}), 400
+    start, end, total = (int(value) for value in match.groups())
+    if start > end or end >= total:
+        return jsonify({'error': f'Invalid Content-Range: {content_range}'}), 400
+    if total > app.config['MAX_CONTENT_LENGTH']:
+        raise RequestEntityTooLarge()
+    
+    file_path = input_dir / filename
+    part_path = input_dir / f".{filename}.{upload_id}.part"
+    meta_path = input_dir / f".{filename}.{upload_id}.meta.json"
+    
+    def already_complete(state):
+        """A retried chunk can arrive after another request already finished the upload"""
+        try:
+            return state.get('complete') and file_path.stat().st_size == total
+        except FileNotFoundError:
+            return False
+    
+    # Check before writing, so a late duplicate doesn't recreate the .part file
+    try:
+        if already_complete(json.loads(meta_path.read_text(encoding='utf-8') or '{}')):
+            return jsonify({'received': total, 'total': total}), 200
+    except (FileNotFoundError, ValueError):
+        pass
+    
+    # Every chunk writes into the same sparse file at its own offset
+    fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+    with os.fdopen(fd, 'r+b', buffering=UPLOAD_BUFFER_SIZE) as f:
+        f.seek(start)
+        written = copy_request_body(f)
+    if written != end - start + 1:
+        return jsonify({'error': f'Chunk size {written} does not match Content-Range {content_range}'}), 400
+    
+    with open(meta_path, 'a+', encoding='utf-8') as meta:
+        if fcntl is not None:
+            fcntl.flock(meta, fcntl.LOCK_EX)
+        meta.seek(0)
+        state = json.loads(meta.read() or '{}')
+        if already_complete(state):
+            # Finished while this chunk was being written; drop the .part it may have recreated
+            part_path.unlink(missing_ok=True)
+            return jsonify({'received': total, 'total': total}), 200
+        if state.get('total') != total or not isinstance(state.get('ranges'), list):
+            state = {'total': total, 'ranges': []}
+        # Merged intervals, so retried or overlapping chunks aren't counted twice
+        state['ranges'] = merge_ranges(state['ranges'] + [[start, end]])
+        received = sum(stop - offset + 1 for offset, stop in state['ranges'])
+        
+        # Complete only when one interval covers [0, total) and the file really has every byte
+        try:
+            part_size = os.path.getsize(part_path)
+        except FileNotFoundError:
+            # The .part was swept away as abandoned; the client has to start over
+            meta_path.unlink(missing_ok=True)
+            return jsonify({'error': 'Upload expired, please upload the file again'}), 409
+        complete = state['ranges'] == [[0, total - 1]] and part_size == total
+        if complete:
+            os.replace(part_path, file_path)
+            # Keep the sidecar as a completion marker for late retries; the stale-upload
+            # sweep removes it later
+            state = {'total': total, 'complete': True}
+        meta.seek(0)
+        meta.truncate()
+        meta.write(json.dumps(state))
+    
+    if not complete:
+        return jsonify({'received': received, 'total': total}), 200
+    
+    logger.info("File uploaded in chunks: %s", file_path)
+    return start_processing(filename)
+
+@app.route('/upload_stream', methods=['POST'])
+def upload_stream():
+    """
+    Handle a raw (non-multipart) upload and trigger pipeline processing with Celery.
+    
+    The request body is the video itself and the original filename is sent URL-encoded
+    in the X-Filename header, so the body is copied straight to disk without multipart parsing.
+    Large files can be sent as several requests with Content-Range and X-Upload-Id headers.
+    """
+    part_path = None
+    try:
+        client_filename = unquote(request.headers.get('X-Filename', ''))
+        if not client_filename:
+            return jsonify({'error': 'No file selected'}), 400
+        
+        filename, error = resolve_upload_name(client_filename)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        ensure_directories()
+        input_dir = Path(INPUT_FOLDER)
+        
+        content_range = request.headers.get('Content-Range')
+        if content_range:
+            upload_id = request.headers.get('X-Upload-Id', '')
+            if not UPLOAD_ID_RE.fullmatch(upload_id):
+                return jsonify({'error': 'Missing or invalid X-Upload-Id'}), 400
+            return save_upload_chunk(input_dir, filename, upload_id, content_range)
+        
+        file_path = input_dir / filename
+        part_path = input_dir / f".{filename}.part"
+        
+        # Copy the body to disk in fixed-size chunks so memory use doesn't grow with the video
+        with open(part_path, 'wb', buffering=UPLOAD_BUFFER_SIZE) as f:
+            copy_request_body(f)
+        
+        if part_path.stat().st_size == 0:
+            part_path.unlink()
+            return jsonify({'error': 'Empty upload'}), 400
+        
+        os.replace(part_path, file_path)
+        logger.info("File uploaded: %s", file_path)
+        
+        return start_processing(filename)
+    
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        # One call logs the message and the traceback
+        logger.exception("❌ Upload failed")
+        
+        return jsonify({
+            'error': 'Upload failed',
+            'details': str(e)
+        }), 500
+    finally:
+        # Drop whatever was written if the client disconnected or the body was too large
+        if part_path is not None and part_path.exists():
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
@@ -293,182 +505,252 @@ def upload_file():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        # Get paths from config
-        input_folder, output_folder = get_config_paths()
+        filename, error = resolve_upload_name(file.filename)
+        if error:
+            return jsonify({'error': error}), 400
         
-        # Clean up old output files to avoid confusion
-        output_dir = Path(output_folder)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        for old_file in output_dir.glob('*.mp4'):
-            try:
-                old_file.unlink()
-                logger.info(f"🗑️ Removed old output file: {old_file.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not remove old file {old_file.name}: {str(e)}")
+        # Input directory is normally created by validate_environment() at startup;
+        # old inputs/outputs are cleaned up by the Celery task
+        ensure_directories()
+        input_dir = Path(INPUT_FOLDER)
         
-        # Create input directory
-        input_dir = Path(input_folder)
-        input_dir.mkdir(exist_ok=True)
-        
-        # Clean up old input files
-        for old_file in input_dir.glob('*'):
-            try:
-                old_file.unlink()
-                logger.info(f"🗑️ Removed old input file: {old_file.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not remove old file {old_file.name}: {str(e)}")
-        
-        # Save uploaded file
-        file_path = input_dir / file.filename
-        file.save(file_path)
-        
-        logger.info(f"File uploaded: {file_path}")
+        file_path = input_dir / filename
+        stream_path = getattr(file.stream, 'name', None)
+        if isinstance(stream_path, str) and Path(stream_path).parent == input_dir:
+            # The multipart parser already spooled the file into the input folder
+            # (see UploadRequest), so moving it into place is a rename, not a copy
+            file.stream.flush()
+            os.replace(stream_path, file_path)
+        else:
+            # Save uploaded file under a hidden temporary name, then rename it into place
+            # so the pipeline never sees a partially written video
+            part_path = input_dir / f".{filename}.part"
+            file.save(part_path, buffer_size=UPLOAD_BUFFER_SIZE)
+            os.replace(part_path, file_path)
         
-        # Small delay to ensure file is fully written
-        import time
-        time.sleep(1)
+        logger.info("File uploaded: %s", file_path)
         
         # Start Celery task for video processing
-        task = process_video_task.delay(file.filename)
-        
-        # Return task ID for status tracking
-        return jsonify({
-            'message': 'Video upload successful! Processing started.',
-            'task_id': task.id,
-            'status': 'PROCESSING',
-            'filename': file.filename
-        })
-            
+        return start_processing(filename)
+    
+    except RequestEntityTooLarge:
+        # Raised by werkzeug from the Content-Length check, before the body is read
+        raise
     except Exception as e:
-        # Add traceback to logs for detailed error information
-        logger.error("❌ Upload error occurred:")
-        logger.error(f"Error: {str(e)}")
-        logger.error("Full traceback:")
-        traceback.print_exc()
+        # One call logs the message and the traceback
+        logger.exception("❌ Upload failed")
         
         return jsonify({
             'error': 'Upload failed',
             'details': str(e)
         }), 500
 
+TASK_TERMINAL_STATES = {'SUCCESS', 'FAILURE', 'REVOKED'}
+
+# /task/<id>/events re-checks the result backend this often in case a notification was missed
+TASK_EVENTS_KEEPALIVE_SECONDS = 15
+
+# Used until the worker has recorded some real run times
+DEFAULT_PROCESSING_MINUTES = 3
+
+# The median run time is re-read from Redis at most once per ETA_CACHE_SECONDS
+ETA_CACHE_SECONDS = 60
+_eta_minutes_cache = None
+_eta_minutes_time = 0.0
+
+def get_estimated_processing_minutes():
+    """Median duration of the last TASK_DURATIONS_KEPT successful runs, in minutes"""
+    global _eta_minutes_cache, _eta_minutes_time
+    now = time.monotonic()
+    if _eta_minutes_cache is not None and now - _eta_minutes_time < ETA_CACHE_SECONDS:
+        return _eta_minutes_cache
+    
+    try:
+        from celery_app import TASK_DURATIONS_KEY, get_redis_client
+        durations = sorted(float(d) for d in get_redis_client().lrange(TASK_DURATIONS_KEY, 0, -1))
+    except Exception as e:
+        logger.warning("⚠️ Could not read task durations: %s", e)
+        durations = []
+    
+    _eta_minutes_cache = durations[len(durations) // 2] / 60 if durations else DEFAULT_PROCESSING_MINUTES
+    _eta_minutes_time = now
+    return _eta_minutes_cache
+
+def build_task_status(task_id):
+    """Build the status payload shared by /task/<id> and /task/<id>/events"""
+    from celery_app import process_video_task
+    
+    # One public backend read; AsyncResult.state/.info would each fetch the meta again until it's ready
+    meta = process_video_task.backend.get_task_meta(task_id)
+    state = meta['status']
+    info = meta['result']
+    
+    # Calculate ETA for processing tasks
+    eta_minutes = None
+    if state in ['PENDING', 'PROGRESS']:
+        # Median duration of recent successful runs
+        estimated_processing_time = get_estimated_processing_minutes()
+        
+        if state == 'PENDING':
+            eta_minutes = estimated_processing_time
+        elif state == 'PROGRESS':
+            # Calculate remaining time based on progress
+            progress = info.get('progress', 0) if info else 0
+            started_at = info.get('started_at') if info else None
+            if progress > 0:
+                # Estimate remaining time based on progress percentage
+                remaining_progress = 100 - progress
+                eta_minutes = max(1, (remaining_progress / progress) * estimated_processing_time)
+            elif started_at:
+                elapsed_minutes = (time.time() - started_at) / 60
+                eta_minutes = max(1, estimated_processing_time - elapsed_minutes)
+            else:
+                eta_minutes = estimated_processing_time
+    
+    if state == 'PENDING':
+        response = {
+            'state': state,
+            'status': 'Task is waiting to be processed...',
+            'eta_minutes': eta_minutes
+        }
+    elif state == 'PROGRESS':
+        response = {
+            'state': state,
+            'status': info.get('status', 'Processing...'),
+            'progress': info.get('progress', 0),
+            'eta_minutes': eta_minutes
+        }
+    elif state == 'SUCCESS':
+        response = {
+            'state': state,
+            'status': 'Task completed successfully!',
+            'result': info,
+            'eta_minutes': 0
+        }
+    elif state == 'FAILURE':
+        response = {
+            'state': state,
+            'status': 'Task failed',
+            'error': str(info),
+            'eta_minutes': None
+        }
+    elif state == 'REVOKED':
+        response = {
+            'state': state,
+            'status': 'Task expired before a worker picked it up',
+            'error': 'Task expired before processing started - please upload again',
+            'eta_minutes': None
+        }
+    else:
+        response = {
+            'state': state,
+            'status': 'Unknown state',
+            'eta_minutes': None
+        }
+    
+    return response
+
 @app.route('/task/<task_id>')
 def get_task_status(task_id):
     """Get the status of a Celery task"""
     try:
-        task = process_video_task.AsyncResult(task_id)
-        
-        # Calculate ETA for processing tasks
-        eta_minutes = None
-        if task.state in ['PENDING', 'PROGRESS']:
-            # Estimate processing time based on typical video processing
-            # Average processing time: 2-4 minutes for 1-minute videos
-            estimated_processing_time = 3  # minutes
-            
-            if task.state == 'PENDING':
-                eta_minutes = estimated_processing_time
-            elif task.state == 'PROGRESS':
-                # Calculate remaining time based on progress
-                progress = task.info.get('progress', 0) if task.info else 0
-                if progress > 0:
-                    # Estimate remaining time based on progress percentage
-                    remaining_progress = 100 - progress
-                    eta_minutes = max(1, (remaining_progress / progress) * estimated_processing_time)
-                else:
-                    eta_minutes = estimated_processing_time
-        
-        if task.state == 'PENDING':
-            response = {
-                'state': task.state,
-                'status': 'Task is waiting to be processed...',
-                'eta_minutes': eta_minutes
-            }
-        elif task.state == 'PROGRESS':
-            response = {
-                'state': task.state,
-                'status': task.info.get('status', 'Processing...'),
-                'progress': task.info.get('progress', 0),
-                'eta_minutes': eta_minutes
-            }
-        elif task.state == 'SUCCESS':
-            response = {
-                'state': task.state,
-                'status': 'Task completed successfully!',
-                'result': task.result,
-                'eta_minutes': 0
-            }
-        elif task.state == 'FAILURE':
-            response = {
-                'state': task.state,
-                'status': 'Task failed',
-                'error': str(task.info),
-                'eta_minutes': None
-            }
-        else:
-            response = {
-                'state': task.state,
-                'status': 'Unknown state',
-                'eta_minutes': None
-            }
-        
-        return jsonify(response)
+        return jsonify(build_task_status(task_id))
         
     except Exception as e:
-        logger.error(f"Error getting task status: {str(e)}")
+        logger.error("Error getting task status: %s", e)
         return jsonify({'error': str(e)}), 500
 
+@app.route('/task/<task_id>/events')
+def task_events(task_id):
+    """
+    Stream task status changes as Server-Sent Events.
+    
+    The worker publishes on the task's Redis channel whenever the state changes, so the
+    result backend is only queried on a change (or every TASK_EVENTS_KEEPALIVE_SECONDS)
+    instead of on every poll. /task/<id> remains available as a fallback.
+    """
+    from celery_app import get_redis_client, task_event_channel
+    
+    def generate():
+        pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+        # Subscribe before the first read so a change in between isn't lost
+        pubsub.subscribe(task_event_channel(task_id))
+        try:
+            last_status = None
+            while True:
+                status = build_task_status(task_id)
+                if status != last_status:
+                    yield f"data: {app.json.dumps(status)}\n\n"
+                    last_status = status
+                if status['state'] in TASK_TERMINAL_STATES:
+                    return
+                
+                if pubsub.get_message(timeout=TASK_EVENTS_KEEPALIVE_SECONDS) is None:
+                    yield ": keepalive\n\n"
+        except Exception as e:
+            logger.error("Error streaming task events: %s", e)
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+        finally:
+            pubsub.close()
+    
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/task/<task_id>/result')
 def get_task_result(task_id):
     """Get the result of a completed Celery task"""
     try:
-        task = process_video_task.AsyncResult(task_id)
+        from celery_app import process_video_task
+        meta = process_video_task.backend.get_task_meta(task_id)
+        state = meta['status']
         
-        logger.info(f"🔍 Task {task_id} state: {task.state}")
+        logger.debug("🔍 Task %s state: %s", task_id, state)
         
-        if task.state == 'SUCCESS':
-            result = task.result
-            logger.info(f"🔍 Task result: {result}")
+        if state == 'SUCCESS':
+            result = meta['result']
+            logger.debug("🔍 Task result: %s", result)
             
             if result.get('status') == 'SUCCESS':
                 # Always redirect to result page - it will handle short clips display
                 video_base_name = result.get('video_base_name')
-                logger.info(f"🔍 Video base name: {video_base_name}")
+                logger.debug("🔍 Video base name: %s", video_base_name)
                 
                 if not video_base_name:
-                    logger.error(f"❌ No video base name in result: {result}")
+                    logger.error("❌ No video base name in result: %s", result)
                     return jsonify({'error': 'No video base name in result'}), 500
                 
                 result_url = url_for('show_result', video_base_name=video_base_name)
-                logger.info(f"🔍 Redirecting to: {result_url}")
+                logger.debug("🔍 Redirecting to: %s", result_url)
                 return redirect(result_url)
             else:
-                logger.warning(f"⚠️ Task result status is not SUCCESS: {result.get('status')}")
+                logger.warning("⚠️ Task result status is not SUCCESS: %s", result.get('status'))
                 return jsonify(result)
-        elif task.state == 'FAILURE':
-            logger.error(f"❌ Task {task_id} failed: {task.info}")
+        elif state == 'FAILURE':
+            logger.error("❌ Task %s failed: %s", task_id, meta['result'])
             return jsonify({
                 'error': 'Task failed',
-                'details': str(task.info)
+                'details': str(meta['result'])
             }), 500
         else:
-            logger.info(f"⏳ Task {task_id} not completed yet, state: {task.state}")
+            logger.debug("⏳ Task %s not completed yet, state: %s", task_id, state)
             return jsonify({
                 'error': 'Task not completed yet',
-                'state': task.state
+                'state': state
             }), 202
             
     except Exception as e:
-        logger.error(f"❌ Error getting task result: {str(e)}")
-        traceback.print_exc()
+        logger.exception("❌ Error getting task result")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/task/<task_id>/cleanup', methods=['POST'])
 def cleanup_task_files(task_id):
     """Clean up files after task completion"""
     try:
-        task = process_video_task.AsyncResult(task_id)
+        from celery_app import process_video_task, cleanup_task
+        meta = process_video_task.backend.get_task_meta(task_id)
         
-        if task.state == 'SUCCESS' and task.result:
-            filename = task.result.get('filename')
+        if meta['status'] == 'SUCCESS' and meta['result']:
+            filename = meta['result'].get('filename')
             if filename:
                 cleanup_task.delay(filename)
                 return jsonify({'message': 'Cleanup task started'})
@@ -476,13 +758,15 @@ def cleanup_task_files(task_id):
         return jsonify({'error': 'No cleanup needed or task not completed'}), 400
         
     except Exception as e:
-        logger.error(f"Error starting cleanup task: {str(e)}")
+        logger.error("Error starting cleanup task: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/cleanup/<video_base_name>', methods=['POST'])
 def manual_cleanup(video_base_name):
     """Manually trigger cleanup for a specific video"""
     try:
+        from celery_app import auto_cleanup_task
+        
         # Start the auto-cleanup task immediately
         task = auto_cleanup_task.delay(video_base_name)
         
@@ -492,7 +776,7 @@ def manual_cleanup(video_base_name):
         })
         
     except Exception as e:
-        logger.error(f"Error starting manual cleanup: {str(e)}")
+        logger.error("Error starting manual cleanup: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/health')
@@ -500,25 +784,30 @@ def health_check():
     """Health check endpoint"""
     return jsonify({'status': 'healthy', 'message': 'Video automation pipeline is running'})
 
+# /debug payload is rebuilt at most once per DEBUG_CACHE_SECONDS
+DEBUG_CACHE_SECONDS = 30
+_debug_info_cache = None
+_debug_info_time = 0.0
+
 @app.route('/debug')
 def debug_info():
     """Debug endpoint to show environment and system info"""
+    global _debug_info_cache, _debug_info_time
     try:
+        now = time.monotonic()
+        if _debug_info_cache is not None and now - _debug_info_time < DEBUG_CACHE_SECONDS:
+            return jsonify(_debug_info_cache)
+        
         # Check ffmpeg
-        ffmpeg_status = "unknown"
-        try:
-            result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=5)
-            ffmpeg_status = "available" if result.returncode == 0 else "error"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            ffmpeg_status = "not_found"
+        ffmpeg_status = get_ffmpeg_status()
         
         # Check directories
-        input_folder, output_folder = get_config_paths()
-        input_dir = Path(input_folder)
-        output_dir = Path(output_folder)
+        input_dir = Path(INPUT_FOLDER)
+        output_dir = Path(OUTPUT_FOLDER)
         
-        return jsonify({
+        _debug_info_cache = {
             'ffmpeg_status': ffmpeg_status,
+            'openai_available': get_openai_available(),
             'input_directory_exists': input_dir.exists(),
             'output_directory_exists': output_dir.exists(),
             'input_directory_writable': input_dir.is_dir() and os.access(input_dir, os.W_OK),
@@ -529,24 +818,164 @@ def debug_info():
                 'PORT': os.environ.get('PORT'),
                 'PYTHONPATH': os.environ.get('PYTHONPATH')
             }
-        })
+        }
+        _debug_info_time = now
+        return jsonify(_debug_info_cache)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Shared secret for /debug/refresh; the endpoint is disabled when this is unset
+DEBUG_REFRESH_TOKEN = os.environ.get('DEBUG_REFRESH_TOKEN')
+
+@app.route('/debug/refresh', methods=['POST'])
+def refresh_debug_info():
+    """Re-probe ffmpeg and openai and drop the cached /debug payload (requires X-Admin-Token)"""
+    global _FFMPEG_STATUS, _OPENAI_AVAILABLE, _debug_info_cache
+    if not DEBUG_REFRESH_TOKEN:
+        return jsonify({'error': 'Not found'}), 404
+    if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), DEBUG_REFRESH_TOKEN):
+        return jsonify({'error': 'Forbidden'}), 403
+    
+    _FFMPEG_STATUS = None
+    _OPENAI_AVAILABLE = None
+    _debug_info_cache = None
+    return jsonify({
+        'ffmpeg_status': get_ffmpeg_status(),
+        'openai_available': get_openai_available()
+    })
+
 @app.route('/logs')
 def get_logs():
     """Get recent logs"""
     try:
         log_file = Path('pipeline.log')
         if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                logs = f.read()
-            return jsonify({'logs': logs})
+            offset = request.args.get('offset', type=int)
+            max_bytes = requested_log_bytes()
+            
+            # The response only changes when the log is written to, so pollers can get a 304
+            stat = log_file.stat()
+            etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}-{offset}-{max_bytes}"
+            # gzip_response() tags a compressed body "<etag>-gzip"; only that client can revalidate it
+            validators = (f"{etag}-gzip", etag) if accepts_gzip() else (etag,)
+            cached = next((tag for tag in validators if request.if_none_match.contains(tag)), None)
+            if cached:
+                response = Response(status=304)
+                etag = cached
+            else:
+                logs, offset = read_log_tail(log_file, offset=offset, max_bytes=max_bytes)
+                response = jsonify({'logs': logs, 'offset': offset})
+            response.set_etag(etag)
         else:
-            return jsonify({'logs': 'No logs available yet'})
+            response = jsonify({'logs': 'No logs available yet', 'offset': 0})
+        
+        # Always revalidate; a stale cached log is never useful
+        response.cache_control.no_cache = True
+        return gzip_response(response)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# How often /logs/stream checks pipeline.log for new lines (and waits on the task's channel)
+LOG_STREAM_POLL_SECONDS = 0.5
+
+@app.route('/logs/stream')
+def stream_logs():
+    """
+    Push new pipeline.log lines to the browser as Server-Sent Events.
+    
+    Pass ?task_id=<id> to end the stream once that task has finished; completion is learned
+    from the task's Redis channel, with the result backend checked only on each keepalive.
+    A keepalive comment is sent while the log is idle so a closed tab is noticed and the
+    thread freed.
+    """
+    task_id = request.args.get('task_id')
+    log_file = Path('pipeline.log')
+    from celery_app import celery_app, get_redis_client, task_event_channel
+    
+    def generate():
+        f = None
+        position = 0
+        pubsub = None
+        try:
+            if task_id:
+                pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+                # Subscribe before checking the backend so a finish in between isn't lost
+                pubsub.subscribe(task_event_channel(task_id))
+                task_done = celery_app.AsyncResult(task_id).ready()
+            else:
+                task_done = False
+            last_sent = time.monotonic()
+            
+            while True:
+                if f is None and log_file.exists():
+                    f = open(log_file, 'rb')
+                    # Start from the recent tail rather than replaying the whole log
+                    size = f.seek(0, os.SEEK_END)
+                    if size > LOG_TAIL_BYTES:
+                        f.seek(size - LOG_TAIL_BYTES)
+                        f.readline()  # Skip the partial first line
+                    else:
+                        f.seek(0)
+                    position = f.tell()
+                
+                if f is not None:
+                    lines = f.readlines()
+                    # Leave a half-written last line for the next pass
+                    if lines and not lines[-1].endswith(b'\n'):
+                        f.seek(-len(lines.pop()), os.SEEK_CUR)
+                    position = f.tell()
+                    if lines:
+                        yield ''.join(
+                            f"data: {line.decode('utf-8', errors='replace').rstrip()}\n\n" for line in lines
+                        )
+                        last_sent = time.monotonic()
+                    else:
+                        # The worker clears the log for each new video and it also rotates
+                        try:
+                            if log_file.stat().st_size < position:
+                                f.close()
+                                f = None
+                        except FileNotFoundError:
+                            f.close()
+                            f = None
+                
+                # Lines written before the final state was published have been sent above
+                if task_done:
+                    yield "event: done\ndata: \n\n"
+                    return
+                
+                if time.monotonic() - last_sent >= TASK_EVENTS_KEEPALIVE_SECONDS:
+                    yield ": keepalive\n\n"
+                    last_sent = time.monotonic()
+                    # A revoked/expired task never publishes a final state (and a publish can be
+                    # missed), so fall back to the result backend once per keepalive
+                    if task_id and celery_app.AsyncResult(task_id).ready():
+                        task_done = True
+                        continue
+                
+                if pubsub is not None:
+                    message = pubsub.get_message(timeout=LOG_STREAM_POLL_SECONDS)
+                    if message is not None:
+                        state = message['data']
+                        if isinstance(state, bytes):
+                            state = state.decode()
+                        if state in TASK_TERMINAL_STATES:
+                            task_done = True
+                else:
+                    time.sleep(LOG_STREAM_POLL_SECONDS)
+        finally:
+            if f is not None:
+                f.close()
+            if pubsub is not None:
+                pubsub.close()
+    
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def format_size_mb(size):
+    """Format a byte count as megabytes rounded to two decimals (e.g. "1.5 MB")"""
+    return f"{round(size / (1024 * 1024), 2)} MB"
+
 @app.route('/result')
 def show_result():
     """Display processed video with download and logs"""
@@ -556,49 +985,42 @@ def show_result():
         if not video_base_name:
             return jsonify({'error': 'No video base name specified'}), 400
         
-        
-        _, output_folder = get_config_paths()
-        output_dir = Path(output_folder)
-        
-        # Look for short clips
+        # One scandir pass finds both the short clips and the main video; on Linux the
+        # entry's file type comes from the directory listing, so only the sizes cost a stat
+        clip_prefix = f"{video_base_name}_short_"
+        main_video_name = f"{video_base_name}_with_subs_trimmed.mp4"
         short_clips = []
-        pattern = f"{video_base_name}_short_*.mp4"
-        for clip_file in output_dir.glob(pattern):
-            if clip_file.is_file():
-                clip_size = round(clip_file.stat().st_size / (1024 * 1024), 2)
-                short_clips.append({
-                    'filename': clip_file.name,
-                    'url': f'/output/{clip_file.name}',
-                    'size': f"{clip_size} MB"
-                })
+        main_video = None
+        try:
+            with os.scandir(OUTPUT_FOLDER) as entries:
+                for entry in entries:
+                    name = entry.name
+                    is_clip = name.startswith(clip_prefix) and name.endswith('.mp4')
+                    if (is_clip or name == main_video_name) and entry.is_file():
+                        video = {
+                            'filename': name,
+                            'url': f'/output/{name}',
+                            'size': format_size_mb(entry.stat().st_size)
+                        }
+                        if is_clip:
+                            short_clips.append(video)
+                        else:
+                            main_video = video
+        except FileNotFoundError:
+            pass  # No output folder yet means no clips
         # Sort clips by name (short_1, short_2, etc.)
         short_clips.sort(key=lambda x: x['filename'])
         
-        # Look for main processed video as fallback
-        main_video = None
-        main_video_pattern = f"{video_base_name}_with_subs_trimmed.mp4"
-        main_video_path = output_dir / main_video_pattern
-        if main_video_path.exists():
-            file_size = main_video_path.stat().st_size
-            file_size_mb = round(file_size / (1024 * 1024), 2)
-            main_video = {
-                'filename': main_video_path.name,
-                'url': f'/output/{main_video_path.name}',
-                'size': f"{file_size_mb} MB"
-            }
-        
         # Read logs from pipeline.log
         log_file = Path('pipeline.log')
         logs = "No logs available yet."
         if log_file.exists():
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    logs = f.read()
+                logs, _ = read_log_tail(log_file, max_bytes=requested_log_bytes())
             except Exception as e:
                 logs = f"Error reading logs: {str(e)}"
         
         # Get current timestamp
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         return render_template('result.html', 
@@ -608,25 +1030,40 @@ def show_result():
                              timestamp=timestamp,
                              logs=logs)
     except Exception as e:
-        logger.error(f"Error in show_result: {str(e)}")
+        logger.error("Error in show_result: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/output/<path:filename>')
 def serve_video(filename):
     """Serve output video files"""
     try:
-        _, output_folder = get_config_paths()
-        return send_from_directory(output_folder, filename)
+        if X_ACCEL_REDIRECT_PREFIX:
+            file_path = safe_join(OUTPUT_FOLDER, filename)
+            if file_path is None or not os.path.isfile(file_path):
+                raise FileNotFoundError(filename)
+            
+            # Let nginx sendfile() the video instead of streaming it through the worker
+            response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+            response.headers['X-Accel-Redirect'] = f"{X_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(filename)}"
+            response.cache_control.public = True
+            response.cache_control.max_age = OUTPUT_CACHE_MAX_AGE
+            return response
+        
+        # ETag/Last-Modified let repeat views revalidate with a 304 instead of re-downloading
+        return send_from_directory(OUTPUT_FOLDER, filename, conditional=True, max_age=OUTPUT_CACHE_MAX_AGE)
     except Exception as e:
-        logger.error(f"Error serving video {filename}: {str(e)}")
+        logger.error("Error serving video %s: %s", filename, e)
         return jsonify({'error': f'File not found: {filename}'}), 404
 
+# Validate once per process at import so `python app.py` and `gunicorn app:app` behave the same;
+# in a background thread so the ffmpeg probe doesn't delay the app becoming ready
+if os.environ.get('SKIP_VALIDATION') != '1':
+    threading.Thread(target=validate_environment, name='validate-environment', daemon=True).start()
+
 if __name__ == '__main__':
-    # Validate environment before starting
-    validate_environment()
-    
+    # Development server only - production runs `gunicorn app:app` (see gunicorn.conf.py)
     # Get port from environment (Railway sets this)
     port = int(os.environ.get('PORT', 8000))
     
-    logger.info(f"🚀 Starting web server on port {port}")
+    logger.info("🚀 Starting web server on port %s", port)
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -1,16 +1,17 @@
 import os
-import sys
-import json
-import subprocess
-import traceback
+import re
+import fnmatch
+import time
 from pathlib import Path
 from celery import Celery
+from kombu import Exchange, Queue
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import task_postrun, worker_process_init
 import logging
+import redis
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.absolute()
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+import run_pipeline
+from config.paths import get_config_paths
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -19,13 +20,19 @@ logger = logging.getLogger(__name__)
 # Create Celery app
 celery_app = Celery('video_automation')
 
+# Upper bound on Redis connections per process (web threads or worker), shared by kombu,
+# the result backend and the task-event client below
+REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', 20))
+
 # Configure Celery
 celery_app.conf.update(
     broker_url=os.environ.get('REDIS_URL', 'redis://localhost:6379/0'),
     result_backend=os.environ.get('REDIS_URL', 'redis://localhost:6379/0'),
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # msgpack is faster and smaller than json; json stays accepted for messages queued
+    # before the switch
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
     timezone='UTC',
     enable_utc=True,
     task_track_started=True,
@@ -34,38 +41,223 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     task_acks_late=True,
     worker_disable_rate_limits=True,
+    # Reuse pooled broker/backend connections instead of reconnecting per publish
+    broker_pool_limit=int(os.environ.get('CELERY_BROKER_POOL_LIMIT', 10)),
+    broker_transport_options={'max_connections': REDIS_MAX_CONNECTIONS},
+    redis_max_connections=REDIS_MAX_CONNECTIONS,
+    # Long video runs and quick cleanups get separate queues so each worker can use its own
+    # prefetch (see start_worker.py). Cleanup messages are idempotent, so that queue is
+    # transient and the broker doesn't persist them.
+    task_queues=(
+        Queue('video', Exchange('video'), routing_key='video'),
+        Queue('cleanup', Exchange('cleanup', delivery_mode=1), routing_key='cleanup', durable=False),
+    ),
+    task_default_queue='video',
+    task_routes={
+        'celery_app.process_video_task': {'queue': 'video'},
+        'celery_app.cleanup_task': {'queue': 'cleanup'},
+        'celery_app.auto_cleanup_task': {'queue': 'cleanup'},
+    },
 )
 
-def get_config_paths():
-    """Get input and output paths from config file"""
+# Worker pool: the video pipeline is CPU-bound (ffmpeg, transcription), so run it with
+# `--pool=solo` on small hosts or `--pool=prefork --concurrency=<cores>` on larger ones.
+# The cleanup queue runs on its own small `--pool=threads` worker; its tasks are short
+# blocking filesystem calls, so they share nothing with the video pipeline.
+
+# Seconds before the task soft time limit at which the pipeline abandons its current step
+PIPELINE_DEADLINE_MARGIN = 30
+
+# Queued video tasks older than this are dropped by the worker instead of being started
+VIDEO_TASK_EXPIRES = int(os.environ.get('VIDEO_TASK_EXPIRES', 60 * 60))
+
+# Redis connection for pushing task state changes to /task/<id>/events
+_redis_client = None
+
+def get_redis_client():
+    """Return a Redis client for the broker URL, creating it on first use"""
+    global _redis_client
+    if _redis_client is None:
+        pool = redis.ConnectionPool.from_url(celery_app.conf.broker_url, max_connections=REDIS_MAX_CONNECTIONS)
+        _redis_client = redis.Redis(connection_pool=pool)
+    return _redis_client
+
+def task_event_channel(task_id):
+    """Pub/sub channel that carries state-change notifications for one task"""
+    return f'task:{task_id}'
+
+def publish_task_event(task_id, state):
+    """Notify listeners that a task's state changed; the state itself stays in the result backend"""
+    try:
+        get_redis_client().publish(task_event_channel(task_id), state)
+    except redis.RedisError as e:
+        logger.warning("⚠️ Could not publish task event for %s: %s", task_id, e)
+
+def report_progress(task, status, started_at=None):
+    """Store a PROGRESS state for a bound task and notify /task/<id>/events listeners"""
+    task.update_state(state='PROGRESS', meta={'status': status, 'started_at': started_at})
+    publish_task_event(task.request.id, 'PROGRESS')
+
+# Redis list of recent successful pipeline run times (seconds), newest first; feeds the ETA
+TASK_DURATIONS_KEY = 'task_durations'
+TASK_DURATIONS_KEPT = 100
+
+def record_task_duration(seconds):
+    """Remember how long a successful pipeline run took, keeping the last TASK_DURATIONS_KEPT"""
     try:
-        config_path = Path(__file__).parent / "config" / "master_config.json"
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        pipe = get_redis_client().pipeline()
+        pipe.lpush(TASK_DURATIONS_KEY, round(seconds, 1))
+        pipe.ltrim(TASK_DURATIONS_KEY, 0, TASK_DURATIONS_KEPT - 1)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("⚠️ Could not record task duration: %s", e)
+
+# Set once the input/output folders exist; the worker process only needs to create them once
+_DIRS_READY = False
+
+def ensure_directories(input_folder, output_folder):
+    """Create the input and output folders on the first task in this worker process"""
+    global _DIRS_READY
+    if not _DIRS_READY:
+        Path(input_folder).mkdir(parents=True, exist_ok=True)
+        Path(output_folder).mkdir(parents=True, exist_ok=True)
+        _DIRS_READY = True
+
+def remove_files(directory, suffix='', keep=None, prefix='', include_hidden=True):
+    """
+    Delete regular files in a directory using a single scandir pass.
+    
+    Args:
+        directory: Directory to clean
+        suffix: Only remove files whose name ends with this suffix
+        keep: Optional filename to leave in place
+        prefix: Only remove files whose name starts with this prefix
+        include_hidden: Also remove dot-files (uploads still being written use hidden .part names)
         
-        input_folder = config.get('input_folder', './input')
-        output_folder = config.get('output_folder', './output')
+    Returns:
+        Number of files removed
+    """
+    with os.scandir(directory) as entries:
+        paths = [
+            entry.path for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.name != keep
+            and (include_hidden or not entry.name.startswith('.'))
+            and entry.is_file(follow_symlinks=False)
+        ]
+    return batch_unlink(paths)
+
+def iter_matching_files(directory, pattern):
+    """
+    Yield DirEntry objects for regular files in a directory whose name matches a pattern.
+    
+    Uses a single scandir pass; on Linux the file type comes from the directory entry, so
+    no per-file stat is needed. A missing directory yields nothing.
+    
+    Args:
+        directory: Directory to scan
+        pattern: fnmatch-style pattern matched case-sensitively against the file name, or a
+            compiled regex that must match the whole name
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(fnmatch.translate(pattern))
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if pattern.fullmatch(entry.name) and entry.is_file(follow_symlinks=False):
+                    yield entry
+    except FileNotFoundError:
+        return
+
+# Hidden upload files (.part / .meta.json) untouched for this long belong to abandoned uploads
+STALE_UPLOAD_AGE = int(os.environ.get('STALE_UPLOAD_AGE', 60 * 60))
+
+def remove_stale_uploads(directory, max_age=STALE_UPLOAD_AGE):
+    """
+    Delete hidden upload files that haven't been written to for max_age seconds.
+    
+    Uploads in progress rewrite their .part and .meta.json files with every chunk, so only
+    abandoned uploads get old enough to be removed.
+    
+    Args:
+        directory: Input directory holding the hidden upload files
+        max_age: Minimum age in seconds since the last modification
         
-        # Use Hostinger KVM 2 paths
-        input_folder = '/opt/video-automation/input'
-        output_folder = '/opt/video-automation/output'
-        logger.info("🖥️ Running on Hostinger KVM 2 - using Hostinger paths")
+    Returns:
+        Number of files removed
+    """
+    cutoff = time.time() - max_age
+    paths = []
+    for entry in iter_matching_files(directory, '.*'):
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                paths.append(entry.path)
+        except FileNotFoundError:
+            pass
+    return batch_unlink(paths)
+
+def batch_unlink(paths):
+    """
+    Delete a batch of files, opening each parent directory once and unlinking relative to it.
+    
+    Where the platform supports dir_fd, each delete is an unlinkat() against the already
+    open directory, so the kernel doesn't re-resolve the full path for every file.
+    
+    Args:
+        paths: Paths (str or Path) of the files to delete
         
-        return input_folder, output_folder
-    except Exception as e:
-        logger.warning(f"⚠️ Could not read config, using default paths: {str(e)}")
-        # Use Hostinger KVM 2 default paths
-        return '/opt/video-automation/input', '/opt/video-automation/output'
+    Returns:
+        Number of files removed
+    """
+    by_directory = {}
+    for path in paths:
+        directory, name = os.path.split(os.fspath(path))
+        by_directory.setdefault(directory, []).append(name)
+    
+    removed = 0
+    use_dir_fd = os.unlink in os.supports_dir_fd
+    for directory, names in by_directory.items():
+        dir_fd = os.open(directory or '.', os.O_RDONLY) if use_dir_fd else None
+        try:
+            for name in names:
+                try:
+                    if dir_fd is None:
+                        os.unlink(os.path.join(directory, name))
+                    else:
+                        os.unlink(name, dir_fd=dir_fd)
+                    removed += 1
+                except FileNotFoundError:
+                    pass  # Removed concurrently, e.g. by cleanup_task
+                except OSError as e:
+                    logger.warning("⚠️ Could not remove %s: %s", name, e)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    return removed
 
 def clear_pipeline_logs():
     """Clear pipeline logs before processing a new video"""
     try:
-        log_file = Path('pipeline.log')
-        if log_file.exists():
-            log_file.unlink()
-            logger.info("🗑️ Cleared previous pipeline logs")
+        Path('pipeline.log').unlink()
+        logger.info("🗑️ Cleared previous pipeline logs")
+    except FileNotFoundError:
+        pass  # No previous run to clear
     except Exception as e:
-        logger.warning(f"⚠️ Could not clear logs: {str(e)}")
+        logger.warning("⚠️ Could not clear logs: %s", e)
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """
+    Warm per-process state before the first task so it doesn't pay for it.
+    
+    The pipeline itself runs in-process through run_pipeline.main() (imported at module
+    level), so here we only resolve the folders and open the Redis connection.
+    """
+    input_folder, output_folder = get_config_paths()
+    ensure_directories(input_folder, output_folder)
+    try:
+        get_redis_client().ping()
+    except redis.RedisError as e:
+        logger.warning("⚠️ Redis not reachable at worker start: %s", e)
 
 @celery_app.task(bind=True)
 def process_video_task(self, filename):
@@ -74,7 +266,8 @@ def process_video_task(self, filename):
     """
     try:
         # Update task state
-        self.update_state(state='PROGRESS', meta={'status': 'Starting video processing...'})
+        started_at = time.time()
+        report_progress(self, 'Starting video processing...', started_at)
         
         # Clear previous logs and old output files
         clear_pipeline_logs()
@@ -82,84 +275,69 @@ def process_video_task(self, filename):
         # Get paths from config
         input_folder, output_folder = get_config_paths()
         
-        # Clean up old output files to avoid confusion
+        ensure_directories(input_folder, output_folder)
+        input_dir = Path(input_folder)
         output_dir = Path(output_folder)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        for old_file in output_dir.glob('*.mp4'):
-            try:
-                old_file.unlink()
-                logger.info(f"🗑️ Removed old output file: {old_file.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not remove old file {old_file.name}: {str(e)}")
         
-        # Create input directory
-        input_dir = Path(input_folder)
-        input_dir.mkdir(exist_ok=True)
+        # Clean up old output files to avoid confusion
+        removed_outputs = remove_files(output_dir, '.mp4')
         
         # Check if file exists first
         file_path = input_dir / filename
         if not file_path.exists():
             raise FileNotFoundError(f"Input file not found: {file_path}")
         
-        logger.info(f"File found: {file_path}")
+        logger.debug("File found: %s", file_path)
         
-        # Clean up old input files (but keep the current one)
-        for old_file in input_dir.glob('*'):
-            if old_file.name != filename:  # Don't delete the current file
-                try:
-                    old_file.unlink()
-                    logger.info(f"🗑️ Removed old input file: {old_file.name}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not remove old file {old_file.name}: {str(e)}")
+        # Clean up old input files (but keep the current one and any uploads still in progress)
+        removed_inputs = remove_files(input_dir, keep=filename, include_hidden=False)
+        removed_inputs += remove_stale_uploads(input_dir)
+        logger.info("🗑️ Removed %s old output and %s old input files", removed_outputs, removed_inputs)
         
         # Update task state
-        self.update_state(state='PROGRESS', meta={'status': 'Running video pipeline...'})
+        report_progress(self, 'Running video pipeline...', started_at)
         
-        # Run the pipeline
-        result = subprocess.run(
-            ['python', 'run_pipeline.py'],
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 minute timeout
-        )
+        # Run the pipeline in-process so the worker reuses its already imported modules
+        # Give the pipeline a deadline just inside the soft time limit so its
+        # ffmpeg children are killed instead of outliving the task
+        soft_time_limit = (self.request.timelimit or (None, None))[1] or celery_app.conf.task_soft_time_limit
+        deadline = time.monotonic() + soft_time_limit - PIPELINE_DEADLINE_MARGIN
+        
+        output_path = None
+        try:
+            output_path = run_pipeline.main(str(file_path), deadline=deadline)
+            pipeline_error = None
+        except (run_pipeline.PipelineError, SystemExit) as e:
+            pipeline_error = e
         
-        if result.returncode == 0:
-            # Extract the output filename from the logs
-            output_filename = None
-            for line in result.stdout.split('\n'):
-                if 'Output video saved to:' in line:
-                    output_filename = Path(line.split('Output video saved to: ')[1]).name
-                    break
+        if pipeline_error is None:
+            record_task_duration(time.time() - started_at)
             
             # Get video base name (e.g., "test1min" from "test1min.mov")
             video_base_name = Path(filename).stem
             
-            # Scan for short clips that match this video's pattern
-            output_folder, _ = get_config_paths()
-            output_dir = Path(output_folder)
-            
             # Find all short clips for this specific video
             short_clips = []
             pattern = f"{video_base_name}_short_*.mp4"
-            for clip_file in output_dir.glob(pattern):
-                if clip_file.is_file():
-                    short_clips.append({
-                        'filename': clip_file.name,
-                        'size': round(clip_file.stat().st_size / (1024 * 1024), 2)  # Size in MB
-                    })
+            for clip_file in iter_matching_files(output_dir, pattern):
+                short_clips.append({
+                    'filename': clip_file.name,
+                    'size': round(clip_file.stat().st_size / (1024 * 1024), 2)  # Size in MB
+                })
             
             # Sort clips by name (short_1, short_2, etc.)
             short_clips.sort(key=lambda x: x['filename'])
             
-            logger.info(f"🎬 Found {len(short_clips)} short clips for video: {video_base_name}")
+            logger.info("🎬 Found %s short clips for video: %s", len(short_clips), video_base_name)
             
             # Clean up input file after successful processing
             try:
-                if file_path.exists():
-                    file_path.unlink()
-                    logger.info(f"🗑️ Cleaned up input file after successful processing: {filename}")
+                file_path.unlink()
+                logger.info("🗑️ Cleaned up input file after successful processing: %s", filename)
+            except FileNotFoundError:
+                pass  # Already removed by cleanup_task
             except Exception as e:
-                logger.warning(f"⚠️ Could not clean up input file {filename}: {str(e)}")
+                logger.warning("⚠️ Could not clean up input file %s: %s", filename, e)
             
             # Schedule auto-cleanup after 10 minutes (600 seconds)
             try:
@@ -167,9 +345,9 @@ def process_video_task(self, filename):
                     args=[video_base_name],
                     countdown=600  # 10 minutes = 600 seconds
                 )
-                logger.info(f"⏰ Scheduled auto-cleanup for {video_base_name} in 10 minutes")
+                logger.info("⏰ Scheduled auto-cleanup for %s in 10 minutes", video_base_name)
             except Exception as e:
-                logger.warning(f"⚠️ Could not schedule auto-cleanup: {str(e)}")
+                logger.warning("⚠️ Could not schedule auto-cleanup: %s", e)
             
             # Return only short clips with proper URLs
             short_clips_with_urls = []
@@ -185,26 +363,22 @@ def process_video_task(self, filename):
                 'message': f'Video processed successfully! Generated {len(short_clips)} short clips. Auto-cleanup scheduled in 10 minutes.',
                 'short_clips': short_clips_with_urls,
                 'video_base_name': video_base_name,
-                'stdout': result.stdout,
+                'output_filename': output_path.name if output_path else None,
                 'file': str(file_path)
             }
         else:
             # Log detailed error information
             logger.error("❌ Pipeline processing failed:")
-            logger.error(f"Return code: {result.returncode}")
-            logger.error(f"STDOUT: {result.stdout}")
-            logger.error(f"STDERR: {result.stderr}")
+            logger.error("Error: %s", pipeline_error)
             
             return {
                 'status': 'FAILURE',
                 'error': 'Pipeline processing failed',
-                'details': result.stderr,
-                'return_code': result.returncode,
-                'stdout': result.stdout
+                'details': str(pipeline_error)
             }
             
-    except subprocess.TimeoutExpired as e:
-        logger.error(f"❌ Processing timeout: {str(e)}")
+    except SoftTimeLimitExceeded as e:
+        logger.error("❌ Processing timeout: %s", e)
         return {
             'status': 'FAILURE',
             'error': 'Processing timeout - video may be too large',
@@ -212,11 +386,8 @@ def process_video_task(self, filename):
         }
         
     except Exception as e:
-        # Add traceback to logs for detailed error information
-        logger.error("❌ Task error occurred:")
-        logger.error(f"Error: {str(e)}")
-        logger.error("Full traceback:")
-        traceback.print_exc()
+        # logger.exception sends the traceback through the configured handlers
+        logger.exception("❌ Task error occurred: %s", e)
         
         return {
             'status': 'FAILURE',
@@ -224,14 +395,19 @@ def process_video_task(self, filename):
             'details': str(e)
         }
 
-@celery_app.task(bind=True)
+@task_postrun.connect(sender=process_video_task)
+def publish_final_state(task_id=None, state=None, **kwargs):
+    """Tell /task/<id>/events listeners the task finished (the result is stored by now)"""
+    publish_task_event(task_id, state)
+
+# Cleanup runs take milliseconds and nobody reads their state or result, so skip all
+# result backend writes for them
+@celery_app.task(bind=True, track_started=False, ignore_result=True)
 def cleanup_task(self, filename=None):
     """
     Celery task to clean up temporary files
     """
     try:
-        self.update_state(state='PROGRESS', meta={'status': 'Cleaning up temporary files...'})
-        
         # Get paths from config
         input_folder, output_folder = get_config_paths()
         
@@ -239,30 +415,19 @@ def cleanup_task(self, filename=None):
         if filename:
             input_dir = Path(input_folder)
             input_file = input_dir / filename
-            if input_file.exists():
+            try:
                 input_file.unlink()
-                logger.info(f"🗑️ Cleaned up input file: {filename}")
-            else:
-                logger.info(f"ℹ️ Input file not found (already cleaned): {filename}")
-        
-        # Clean up any temporary files in input directory
-        input_dir = Path(input_folder)
-        for temp_file in input_dir.glob('*'):
-            if temp_file.is_file():
-                try:
-                    temp_file.unlink()
-                    logger.info(f"🗑️ Cleaned up input file: {temp_file.name}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not remove input file {temp_file.name}: {str(e)}")
+                logger.info("🗑️ Cleaned up input file: %s", filename)
+            except FileNotFoundError:
+                logger.info("ℹ️ Input file not found (already cleaned): %s", filename)
         
-        # Clean up any temporary files in output directory
-        output_dir = Path(output_folder)
-        for temp_file in output_dir.glob('temp_*'):
-            try:
-                temp_file.unlink()
-                logger.info(f"🗑️ Cleaned up temporary file: {temp_file.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not remove temp file {temp_file.name}: {str(e)}")
+        # Clean up any temporary files in input and output directories; hidden upload
+        # files are left alone unless the upload has been abandoned
+        removed_inputs = remove_files(input_folder, include_hidden=False)
+        removed_stale = remove_stale_uploads(input_folder)
+        removed_temp = remove_files(output_folder, prefix='temp_')
+        logger.info("🗑️ Cleaned up %s input files, %s abandoned uploads and %s temporary files",
+                    removed_inputs, removed_stale, removed_temp)
         
         return {
             'status': 'SUCCESS',
@@ -270,67 +435,45 @@ def cleanup_task(self, filename=None):
         }
         
     except Exception as e:
-        logger.error(f"❌ Cleanup error: {str(e)}")
+        logger.error("❌ Cleanup error: %s", e)
         return {
             'status': 'FAILURE',
             'error': 'Cleanup failed',
             'details': str(e)
         }
 
-@celery_app.task(bind=True)
+@celery_app.task(bind=True, track_started=False, ignore_result=True)
 def auto_cleanup_task(self, video_base_name):
     """
     Celery task to automatically clean up generated files after 10 minutes
     """
     try:
-        logger.info(f"🗑️ Starting auto-cleanup for video: {video_base_name}")
+        logger.info("🗑️ Starting auto-cleanup for video: %s", video_base_name)
         
         # Get paths from config
         input_folder, output_folder = get_config_paths()
         output_dir = Path(output_folder)
         
-        # Find all files related to this video
-        files_to_delete = []
-        
-        # Main processed video
-        main_video_pattern = f"{video_base_name}_with_subs.mp4"
-        for file in output_dir.glob(main_video_pattern):
-            if file.is_file():
-                files_to_delete.append(file)
-        
-        # Short clips
-        short_clips_pattern = f"{video_base_name}_short_*.mp4"
-        for file in output_dir.glob(short_clips_pattern):
-            if file.is_file():
-                files_to_delete.append(file)
-        
-        # Trimmed video
-        trimmed_pattern = f"{video_base_name}_with_subs_trimmed.mp4"
-        trimmed_dir = output_dir / "processed"
-        if trimmed_dir.exists():
-            for file in trimmed_dir.glob(trimmed_pattern):
-                if file.is_file():
-                    files_to_delete.append(file)
-        
-        # Subtitle files
-        subtitle_dir = output_dir / "subtitles"
-        if subtitle_dir.exists():
-            subtitle_pattern = f"{video_base_name}.srt"
-            for file in subtitle_dir.glob(subtitle_pattern):
-                if file.is_file():
-                    files_to_delete.append(file)
+        # Find all files related to this video, scanning each directory once
+        name = re.escape(video_base_name)
+        targets = (
+            # Main processed video and short clips
+            (output_dir, re.compile(name + r'(_with_subs|_short_.*)\.mp4')),
+            # Trimmed video
+            (output_dir / "processed", re.compile(name + r'_with_subs_trimmed\.mp4')),
+            # Subtitle files
+            (output_dir / "subtitles", re.compile(name + r'\.srt')),
+        )
+        files_to_delete = [
+            entry.path
+            for directory, pattern in targets
+            for entry in iter_matching_files(directory, pattern)
+        ]
         
-        # Delete all found files
-        deleted_count = 0
-        for file_path in files_to_delete:
-            try:
-                file_path.unlink()
-                deleted_count += 1
-                logger.info(f"🗑️ Deleted: {file_path.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not delete {file_path.name}: {str(e)}")
+        # Delete all found files in one batch
+        deleted_count = batch_unlink(files_to_delete)
         
-        logger.info(f"✅ Auto-cleanup completed for {video_base_name}: {deleted_count} files deleted")
+        logger.info("✅ Auto-cleanup completed for %s: %s files deleted", video_base_name, deleted_count)
         
         return {
             'status': 'SUCCESS',
@@ -340,7 +483,7 @@ def auto_cleanup_task(self, video_base_name):
         }
         
     except Exception as e:
-        logger.error(f"❌ Auto-cleanup error for {video_base_name}: {str(e)}")
+        logger.error("❌ Auto-cleanup error for %s: %s", video_base_name, e)
         return {
             'status': 'FAILURE',
             'error': 'Auto-cleanup failed',
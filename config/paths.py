@@ -0,0 +1,41 @@
+"""
+Input/output folder resolution shared by the Flask app and the Celery worker
+"""
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Hostinger KVM 2 paths; master_config.json is only consulted when READ_MASTER_CONFIG is set
+DEFAULT_INPUT_FOLDER = '/opt/video-automation/input'
+DEFAULT_OUTPUT_FOLDER = '/opt/video-automation/output'
+
+MASTER_CONFIG_PATH = Path(__file__).parent / 'master_config.json'
+
+@functools.lru_cache(maxsize=1)
+def get_config_paths():
+    """
+    Get input and output paths, resolved once per process.
+
+    Both the web app and the worker call this, so uploads land in the folder the worker reads.
+    Call get_config_paths.cache_clear() to pick up a changed config.
+
+    Returns:
+        (input_folder, output_folder) tuple of strings
+    """
+    if not os.environ.get('READ_MASTER_CONFIG'):
+        logger.info("🖥️ Running on Hostinger KVM 2 - using Hostinger paths")
+        return DEFAULT_INPUT_FOLDER, DEFAULT_OUTPUT_FOLDER
+
+    try:
+        with open(MASTER_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+
+        return (config.get('input_folder', DEFAULT_INPUT_FOLDER),
+                config.get('output_folder', DEFAULT_OUTPUT_FOLDER))
+    except Exception as e:
+        logger.warning("⚠️ Could not read config, using default paths: %s", e)
+        return DEFAULT_INPUT_FOLDER, DEFAULT_OUTPUT_FOLDER
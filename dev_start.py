@@ -9,10 +9,8 @@ import sys
 import logging
 from pathlib import Path
 
-# Add the project root to Python path
+# Running this script puts its directory first on sys.path, so app and its modules import as-is
 project_root = Path(__file__).parent.absolute()
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -34,7 +32,7 @@ def main():
         from app import app
         app.run(host='0.0.0.0', port=8000, debug=True)
     except Exception as e:
-        logger.error(f"❌ Failed to start Flask app: {str(e)}")
+        logger.error("❌ Failed to start Flask app: %s", e)
         sys.exit(1)
 
 if __name__ == '__main__':
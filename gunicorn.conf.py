@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for the video automation web app
+(loaded automatically by `gunicorn app:app` from the project root)
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+
+# Handlers are I/O bound (uploads, log polling, task status), so use threaded workers
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Large uploads can keep a request busy for a while
+timeout = 120
+
+# Each worker validates the environment when it imports app.py (set SKIP_VALIDATION=1 to disable)
@@ -1,10 +1,59 @@
 import os
+import re
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import List, Dict
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
 from dotenv import load_dotenv
 
+# Subtitle lines sent per OpenRouter request when transliterating in batches
+BATCH_SIZE = 32
+# Completion budget per batched line, capped at the model's output limit
+BATCH_TOKENS_PER_LINE = 200
+MAX_COMPLETION_TOKENS = 4096
+
+# (connect, read) timeout in seconds for OpenRouter requests; batched replies can be long
+REQUEST_TIMEOUT = (5, 120)
+
+# Entries kept in the on-disk transliteration cache (oldest are dropped first)
+CACHE_MAX_ENTRIES = 20000
+
+# Text without any Devanagari (credits, numbers, "[music]", already-Roman lines) is left as is
+DEVANAGARI_RE = re.compile(r'[\u0900-\u097F]')
+# Labels the model sometimes puts in front of its answer
+RESPONSE_PREFIX = r'(?:Transliterated text|Roman transliteration|Transliteration|Roman script|Hindi transliteration):'
+LEADING_PREFIXES_RE = re.compile(r'^(?:\s*' + RESPONSE_PREFIX + r')+\s*')
+PREFIXED_LINE_RE = re.compile(RESPONSE_PREFIX)
+NUMBERED_LINE_RE = re.compile(r'^\s*(\d+)\s*[.):]\s*(.*)$')
+
+def iter_srt_blocks(lines: Iterable[str]) -> Iterator[List[str]]:
+    """Yield the lines of each blank-line separated SRT block, one block at a time"""
+    block = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of up to size consecutive items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class AITransliterator:
     """
     AI-based Hindi transliterator using OpenRouter API.
@@ -26,6 +75,58 @@ class AITransliterator:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Keep the TLS connection to OpenRouter alive across requests and retry
+        # rate limits and transient server errors with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['POST'])
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+        
+        # Batched requests in flight at once
+        self.max_concurrency = int(os.getenv('TRANSLIT_CONCURRENCY', '8'))
+        
+        # Transliterations keyed by whitespace-normalized Devanagari text, kept across runs;
+        # subtitles repeat short utterances a lot
+        self.cache_path = project_root / "cache" / "translit_cache.json"
+        self.cache: Dict[str, str] = {}
+        self._cache_dirty = False
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self.cache = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Could not load transliteration cache, starting fresh: {e}")
+    
+    def save_cache(self):
+        """Write new transliterations to the on-disk cache."""
+        if not self._cache_dirty:
+            return
+        entries = list(self.cache.items())[-CACHE_MAX_ENTRIES:]
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(entries), f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._cache_dirty = False
+        except OSError as e:
+            print(f"Could not save transliteration cache: {e}")
+    
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def transliterate_hindi_to_roman(self, hindi_text: str) -> str:
         """
@@ -37,9 +138,14 @@ class AITransliterator:
         Returns:
             str: Hindi text transliterated to natural Roman script
         """
-        if not hindi_text or not hindi_text.strip():
+        if not hindi_text or not DEVANAGARI_RE.search(hindi_text):
             return hindi_text
         
+        cache_key = ' '.join(hindi_text.split())
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Create the prompt for transliteration
             prompt = f"""Transliterate this Hindi text to Roman script (casual style like WhatsApp):
@@ -64,41 +170,121 @@ Roman transliteration:"""
                 "temperature": 0.1  # Low temperature for consistent results
             }
             
-            response = requests.post(self.base_url, headers=self.headers, json=payload)
+            response = self.session.post(self.base_url, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             result = response.json()
             transliterated_text = result['choices'][0]['message']['content'].strip()
             
-            # Clean up the response (remove any prefixes or extra text)
-            prefixes_to_remove = [
-                "Transliterated text:",
-                "Roman transliteration:",
-                "Transliteration:",
-                "Roman script:",
-                "Hindi transliteration:"
-            ]
-            
-            for prefix in prefixes_to_remove:
-                if transliterated_text.startswith(prefix):
-                    transliterated_text = transliterated_text.replace(prefix, "").strip()
-            
-            # Additional cleaning: remove any lines that start with common prefixes
-            lines = transliterated_text.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                line = line.strip()
-                if line and not any(line.startswith(prefix) for prefix in prefixes_to_remove):
-                    cleaned_lines.append(line)
-            
-            transliterated_text = ' '.join(cleaned_lines)
+            # Clean up the response: drop the label in front of the answer and any other
+            # labelled lines, then join what's left into one line
+            transliterated_text = LEADING_PREFIXES_RE.sub('', transliterated_text)
+            transliterated_text = ' '.join(
+                line for line in (line.strip() for line in transliterated_text.split('\n'))
+                if line and not PREFIXED_LINE_RE.match(line)
+            )
             
+            self.cache[cache_key] = transliterated_text
+            self._cache_dirty = True
             return transliterated_text
             
         except Exception as e:
             print(f"Error in AI transliteration: {e}")
             return hindi_text
     
+    def transliterate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Transliterate many texts with one API request per BATCH_SIZE texts.
+        
+        Only texts containing Devanagari are sent; repeated texts are sent once and cached
+        ones not at all. A batch whose reply doesn't
+        contain exactly one numbered line per input falls back to transliterate_hindi_to_roman
+        for each of its texts.
+        
+        Args:
+            texts (List[str]): Hindi texts in Devanagari script
+            
+        Returns:
+            List[str]: Transliterated texts, in the same order
+        """
+        results = list(texts)
+        
+        # Group positions by normalized text so each distinct line is transliterated once
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text and DEVANAGARI_RE.search(text):
+                positions.setdefault(' '.join(text.split()), []).append(i)
+        
+        pending = []
+        for key, indices in positions.items():
+            cached = self.cache.get(key)
+            if cached is None:
+                pending.append(key)
+            else:
+                for i in indices:
+                    results[i] = cached
+        
+        batches = [pending[start:start + BATCH_SIZE] for start in range(0, len(pending), BATCH_SIZE)]
+        
+        # The requests are network-bound, so send the batches concurrently
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for batch, transliterated in zip(batches, executor.map(self._transliterate_numbered, batches)):
+                if transliterated is None:
+                    transliterated = [self.transliterate_hindi_to_roman(text) for text in batch]
+                else:
+                    self.cache.update(zip(batch, transliterated))
+                    self._cache_dirty = True
+                
+                for key, text in zip(batch, transliterated):
+                    for i in positions[key]:
+                        results[i] = text
+        
+        return results
+    
+    def _transliterate_numbered(self, batch: List[str]) -> Optional[List[str]]:
+        """Send a batch as numbered lines in one request; None if the reply can't be matched up"""
+        numbered = "\n".join(f"{i}. {' '.join(text.split())}" for i, text in enumerate(batch, 1))
+        prompt = f"""Transliterate each numbered line of Hindi text to Roman script (casual style like WhatsApp).
+Reply with exactly {len(batch)} lines, numbered the same way and in the same order:
+
+{numbered}"""
+
+        payload = {
+            "model": "anthropic/claude-3-haiku",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a Hindi transliteration expert. Convert Hindi Devanagari text to natural Roman script as Hindi speakers would type it casually. Return ONLY the numbered transliterated lines, no prefixes or explanations."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": min(BATCH_TOKENS_PER_LINE * len(batch), MAX_COMPLETION_TOKENS),
+            "temperature": 0.1
+        }
+        
+        try:
+            response = self.session.post(self.base_url, json=payload, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            content = response.json()['choices'][0]['message']['content']
+        except Exception as e:
+            print(f"Error in AI batch transliteration: {e}")
+            return None
+        
+        lines = {}
+        for line in content.split('\n'):
+            match = NUMBERED_LINE_RE.match(line)
+            if match:
+                lines[int(match.group(1))] = match.group(2).strip()
+        
+        if sorted(lines) != list(range(1, len(batch) + 1)):
+            print(f"Batch transliteration returned {len(lines)} lines for {len(batch)} inputs, retrying one by one")
+            return None
+        
+        return [lines[i] for i in range(1, len(batch) + 1)]
+    
     def transliterate_srt_file(self, srt_path: Path) -> Path:
         """
         Transliterate an SRT file from Hindi Devanagari to natural Roman script using AI.
@@ -116,36 +302,17 @@ Roman transliteration:"""
         output_path = srt_path.parent / f"{srt_path.stem}_ai_roman.srt"
         
         try:
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Split content into subtitle blocks
-            blocks = content.strip().split('\n\n')
-            transliterated_blocks = []
-            
-            for block in blocks:
-                lines = block.split('\n')
-                if len(lines) >= 3:
-                    # First line is subtitle number
-                    number = lines[0]
-                    # Second line is timestamp
-                    timestamp = lines[1]
-                    # Remaining lines are the subtitle text
-                    subtitle_text = '\n'.join(lines[2:])
-                    
-                    # Transliterate the subtitle text using AI
-                    transliterated_text = self.transliterate_hindi_to_roman(subtitle_text)
-                    
-                    # Reconstruct the block
-                    transliterated_block = f"{number}\n{timestamp}\n{transliterated_text}"
-                    transliterated_blocks.append(transliterated_block)
-                else:
-                    # Keep blocks that don't follow the expected format
-                    transliterated_blocks.append(block)
-            
-            # Write the transliterated content
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('\n\n'.join(transliterated_blocks))
+            # Stream the file a group of blocks at a time so memory stays bounded by the group
+            # size; each group is still sent as concurrent batched requests
+            group_size = BATCH_SIZE * self.max_concurrency
+            with open(srt_path, 'r', encoding='utf-8') as src, open(output_path, 'w', encoding='utf-8') as dst:
+                first = True
+                for group in iter_chunks(iter_srt_blocks(src), group_size):
+                    for block in self._transliterate_blocks(group):
+                        if not first:
+                            dst.write('\n\n')
+                        dst.write(block)
+                        first = False
             
             print(f"AI transliterated SRT saved to: {output_path}")
             return output_path
@@ -153,6 +320,24 @@ Roman transliteration:"""
         except Exception as e:
             print(f"Error transliterating SRT file: {e}")
             raise
+        finally:
+            # Write the cache once per file rather than after every group
+            self.save_cache()
+    
+    def _transliterate_blocks(self, blocks: List[List[str]]) -> List[str]:
+        """Transliterate the text of parsed SRT blocks and return them reassembled"""
+        # First line is the number, second the timestamp, the rest the subtitle text
+        subtitle_texts = ['\n'.join(lines[2:]) for lines in blocks if len(lines) >= 3]
+        transliterated_texts = iter(self.transliterate_batch(subtitle_texts))
+        
+        transliterated_blocks = []
+        for lines in blocks:
+            if len(lines) >= 3:
+                transliterated_blocks.append(f"{lines[0]}\n{lines[1]}\n{next(transliterated_texts)}")
+            else:
+                # Keep blocks that don't follow the expected format
+                transliterated_blocks.append('\n'.join(lines))
+        return transliterated_blocks
     
     def transliterate_text_segments(self, segments: list) -> list:
         """
@@ -164,13 +349,18 @@ Roman transliteration:"""
         Returns:
             list: List of segments with transliterated text
         """
-        transliterated_segments = []
+        # Transliterate every segment's text in batched requests
+        texts = [segment['text'] for segment in segments if 'text' in segment]
+        try:
+            transliterated_texts = iter(self.transliterate_batch(texts))
+        finally:
+            self.save_cache()
         
+        transliterated_segments = []
         for segment in segments:
             if 'text' in segment:
-                transliterated_text = self.transliterate_hindi_to_roman(segment['text'])
                 segment_copy = segment.copy()
-                segment_copy['text'] = transliterated_text
+                segment_copy['text'] = next(transliterated_texts)
                 transliterated_segments.append(segment_copy)
             else:
                 transliterated_segments.append(segment)
@@ -1,14 +1,19 @@
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone
 from typing import Dict, List, Optional
 import json
 import os
-import pytz
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 import sys
 import logging
 from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from time import monotonic
 import pickle
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def setup_logging():
     """Configure logging with custom format"""
@@ -29,13 +34,50 @@ def setup_logging():
 # Create logger instance
 logger = setup_logging()
 
+# Weekday names in datetime.weekday() order (Monday == 0)
+_DAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# How long (in seconds) fetched scheduled videos are reused before asking YouTube again
+SCHEDULED_VIDEOS_CACHE_TTL = 300
+
+# YouTube list calls return at most 50 items per page/request
+YOUTUBE_PAGE_SIZE = 50
+# Cap on uploads pages scanned when every page is still from today or unpublished
+UPLOADS_MAX_PAGES = 5
+
 def safe_encode(text: str) -> str:
     return text.encode(sys.stdout.encoding or 'utf-8', errors='ignore').decode()
 
-def safe_log(log_func, message: str):
-    """Safely log messages"""
+def safe_log(log_func, message: str, *args):
+    """Safely log messages (args are %-formatted lazily by the logger)"""
     # Call the original logging function directly
-    log_func(message)
+    log_func(message, *args)
+
+def _parse_hhmm(time_str: str) -> time:
+    """Parse an 'HH:MM' string (raises ValueError if malformed)"""
+    hour, minute = time_str.split(':')
+    return time(int(hour), int(minute))
+
+def _load_json(path) -> Dict:
+    """Read a JSON file, with orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _dump_json(path: Path, data: Dict):
+    """
+    Write data as indented JSON, with orjson when it is installed.
+    Writes to a .tmp sibling and renames it over path, so readers never see a half-written file.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # Same bytes as orjson's output: 2-space indent, UTF-8, no ASCII escaping
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
 
 class ScheduleConfig:
     def __init__(self, config_file: str = 'config/master_config.json', credentials=None):
@@ -47,10 +89,12 @@ class ScheduleConfig:
             credentials: Optional credentials object or path to credentials file (for backward compatibility)
         """
         self.config_file = config_file
-        self.timezone = pytz.timezone('Asia/Kolkata')
+        self.timezone = ZoneInfo('Asia/Kolkata')
         self.youtube = None  # Initialize youtube client as None
         self._scheduled_videos_cache = None  # Cache for scheduled videos
-        self._last_fetch_time = None  # Timestamp of last fetch
+        self._last_fetch_time = None  # monotonic() timestamp of last fetch
+        self._batch_depth = 0  # > 0 while inside batch_updates()
+        self._dirty = False  # in-memory settings not yet written to the config file
         
         # Load configuration
         self.load_config()
@@ -65,22 +109,22 @@ class ScheduleConfig:
                     self.youtube = build('youtube', 'v3', credentials=creds)
                     safe_log(logger.info, "Loaded credentials from file")
                 except Exception as e:
-                    safe_log(logger.error, f"Failed to load credentials from file: {str(e)}")
+                    safe_log(logger.error, "Failed to load credentials from file: %s", e)
             else:
                 # If credentials object is provided directly
                 try:
                     self.youtube = build('youtube', 'v3', credentials=credentials)
                     safe_log(logger.info, "Using provided credentials")
                 except Exception as e:
-                    safe_log(logger.error, f"Failed to use provided credentials: {str(e)}")
+                    safe_log(logger.error, "Failed to use provided credentials: %s", e)
         else:
             # Try to initialize from credentials.json
             self.initialize_youtube()
         
-        safe_log(logger.info, f"Initializing ScheduleConfig with timezone: {self.timezone.zone}")
+        safe_log(logger.info, "Initializing ScheduleConfig with timezone: %s", self.timezone.key)
         if self.youtube:
             safe_log(logger.info, "Successfully validated YouTube credentials")
-        safe_log(logger.info, f"Loading configuration from: {self.config_file}")
+        safe_log(logger.info, "Loading configuration from: %s", self.config_file)
 
     def initialize_youtube(self):
         """Initialize the YouTube client with credentials."""
@@ -88,7 +132,7 @@ class ScheduleConfig:
             # Load credentials
             credentials_path = 'config/credentials.json'
             if not os.path.exists(credentials_path):
-                safe_log(logger.error, f"Credentials file not found at {credentials_path}")
+                safe_log(logger.error, "Credentials file not found at %s", credentials_path)
                 return
             
             with open(credentials_path, 'r') as f:
@@ -105,18 +149,17 @@ class ScheduleConfig:
                 self.youtube.channels().list(part='id', mine=True).execute()
                 safe_log(logger.info, "YouTube client initialized and validated successfully")
             except Exception as e:
-                safe_log(logger.error, f"Failed to validate YouTube connection: {str(e)}")
+                safe_log(logger.error, "Failed to validate YouTube connection: %s", e)
                 self.youtube = None
             
         except Exception as e:
-            safe_log(logger.error, f"Error initializing YouTube client: {str(e)}")
+            safe_log(logger.error, "Error initializing YouTube client: %s", e)
             self.youtube = None
 
     def load_config(self):
         """Load configuration from the config file."""
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = _load_json(self.config_file)
             
             # Load schedule configuration
             schedule_config = config.get('schedule', {})
@@ -126,18 +169,17 @@ class ScheduleConfig:
             
             # Load daily schedule
             self.daily_schedule = {}
-            for day in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']:
+            for day in _DAY_NAMES:
                 time_str = schedule_config.get(day, '20:00')
                 try:
-                    hour, minute = map(int, time_str.split(':'))
-                    self.daily_schedule[day] = time(hour, minute)
+                    self.daily_schedule[day] = _parse_hhmm(time_str)
                 except (ValueError, TypeError):
                     self.daily_schedule[day] = time(20, 0)  # Default to 8 PM
             
-            safe_log(logger.info, f"ScheduleConfig Loaded: videos/day={self.videos_per_day}, interval={self.min_interval_hours}h, max/week={self.max_videos_per_week}")
+            safe_log(logger.info, "ScheduleConfig Loaded: videos/day=%s, interval=%sh, max/week=%s", self.videos_per_day, self.min_interval_hours, self.max_videos_per_week)
             
         except Exception as e:
-            safe_log(logger.error, f"Error loading configuration: {str(e)}")
+            safe_log(logger.error, "Error loading configuration: %s", e)
             # Set default values
             self.videos_per_day = 1
             self.min_interval_hours = 4
@@ -151,32 +193,76 @@ class ScheduleConfig:
                 'saturday': time(11, 0),
                 'sunday': time(11, 0)
             }
+        
+        self._build_weekday_table()
+
+    def _build_weekday_table(self):
+        """Precompute (day_name, scheduled_time) pairs indexed by weekday()"""
+        self._weekday_table = tuple((day, self.daily_schedule[day]) for day in _DAY_NAMES)
 
     def save_config(self):
-        """Save current configuration to master_config.json"""
+        """Save current configuration to master_config.json (deferred inside batch_updates())"""
+        self._build_weekday_table()
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def _update_setting(self, name: str, value):
+        """Set a setting and save it, skipping the write when the value didn't change"""
+        if getattr(self, name) == value:
+            return
+        setattr(self, name, value)
+        self.save_config()
+
+    def flush(self):
+        """Write pending changes to master_config.json, if there are any"""
+        if not self._dirty:
+            return
+        
         config_path = Path(__file__).parent.parent / self.config_file
         
         # Read existing master config if it exists
         master_config = {}
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                master_config = json.load(f)
+            master_config = _load_json(config_path)
         
         # Update schedule_config section
         master_config['schedule_config'] = {
             'daily_schedule': {
-                day: t.strftime('%H:%M')
+                day: f"{t.hour:02d}:{t.minute:02d}"
                 for day, t in self.daily_schedule.items()
             },
             'videos_per_day': self.videos_per_day,
             'min_interval_hours': self.min_interval_hours,
             'max_videos_per_week': self.max_videos_per_week,
-            'timezone': self.timezone.zone
+            'timezone': self.timezone.key
         }
         
         # Save updated master config
-        with open(config_path, 'w') as f:
-            json.dump(master_config, f, indent=4)
+        _dump_json(config_path, master_config)
+        self._dirty = False
+
+    def batch_updates(self):
+        """
+        Defer saving until the block exits, so several setters cost one write.
+        Same as using the ScheduleConfig itself as a context manager.
+        
+        Example:
+            with schedule_config.batch_updates():
+                schedule_config.set_videos_per_day(2)
+                schedule_config.update_schedule('monday', '18:30')
+        """
+        return self
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+        return False
 
     def get_next_publish_time(self, current_time: datetime, day_offset: int = 0) -> datetime:
         """
@@ -195,7 +281,7 @@ class ScheduleConfig:
         
         # Fetch already scheduled videos
         scheduled_videos = self.fetch_scheduled_videos()
-        safe_log(logger.info, f"Found {len(scheduled_videos)} already scheduled videos")
+        safe_log(logger.info, "Found %s already scheduled videos", len(scheduled_videos))
         
         # Check if there's already a published video today
         today = local_time.date()
@@ -212,29 +298,27 @@ class ScheduleConfig:
         # Get the dates of already scheduled videos
         scheduled_dates = {video['scheduled_time'].astimezone(self.timezone).date() for video in scheduled_videos}
         
-        # Try each day starting from the offset
+        # Try each day starting from the offset. This needs more than 7 days: days that
+        # already have a scheduled video are skipped, so a full week can be booked.
+        base_weekday = local_time.weekday()
         for offset in range(day_offset, day_offset + 14):  # Check up to 2 weeks ahead
-            target_day = (local_time.weekday() + offset) % 7
-            day_name = ['monday', 'tuesday', 'wednesday', 'thursday', 
-                       'friday', 'saturday', 'sunday'][target_day]
-            scheduled_time = self.daily_schedule[day_name]
+            day_name, scheduled_time = self._weekday_table[(base_weekday + offset) % 7]
             
             # Calculate the date for the target day
-            target_date = local_time.date() + timedelta(days=offset)
+            target_date = today + timedelta(days=offset)
             
             # Skip if this day already has a scheduled video
             if target_date in scheduled_dates:
-                safe_log(logger.info, f"Skipping {target_date} as it already has a scheduled video")
+                safe_log(logger.info, "Skipping %s as it already has a scheduled video", target_date)
                 continue
             
             # Create the target datetime
-            target_datetime = datetime.combine(target_date, scheduled_time)
-            target_datetime = self.timezone.localize(target_datetime)
+            target_datetime = datetime.combine(target_date, scheduled_time, tzinfo=self.timezone)
             
             # Only return if the time is in the future
             if target_datetime > local_time:
-                safe_log(logger.info, f"Next available slot: {target_datetime.strftime('%Y-%m-%d %H:%M:%S')} {self.timezone.zone}")
-                return target_datetime.astimezone(pytz.UTC)
+                safe_log(logger.info, "Next available slot: %s %s", target_datetime.strftime('%Y-%m-%d %H:%M:%S'), self.timezone.key)
+                return target_datetime.astimezone(timezone.utc)
         
         # If we get here, we couldn't find a slot in the next two weeks
         safe_log(logger.error, "Could not find an available slot in the next two weeks")
@@ -253,11 +337,14 @@ class ScheduleConfig:
             List[Dict]: List of dictionaries containing schedule and metadata for each video
         """
         if not schedule:
-            schedule = [datetime.now(pytz.UTC)]
+            schedule = [datetime.now(timezone.utc)]
             
         # Get already scheduled videos
         scheduled_videos = self.fetch_scheduled_videos()
-        safe_log(logger.info, f"Found {len(scheduled_videos)} already scheduled videos")
+        safe_log(logger.info, "Found %s already scheduled videos", len(scheduled_videos))
+        
+        # Local dates that already have a video, for O(1) conflict checks
+        scheduled_dates = {video['scheduled_time'].astimezone(self.timezone).date() for video in scheduled_videos}
         
         # Find all available slots at once
         available_slots = []
@@ -267,25 +354,20 @@ class ScheduleConfig:
         
         while len(available_slots) < num_videos and attempts < max_attempts:
             # Check if this date already has a scheduled video
-            date_has_video = any(
-                video['scheduled_time'].astimezone(self.timezone).date() == current_date 
-                for video in scheduled_videos
-            )
-            
-            if not date_has_video:
+            if current_date not in scheduled_dates:
                 # Add the default time for this date
                 slot_time = datetime.combine(current_date, time(20, 0))  # 8:00 PM
-                slot_time = self.timezone.localize(slot_time)
+                slot_time = slot_time.replace(tzinfo=self.timezone)
                 available_slots.append(slot_time)
-                safe_log(logger.info, f"Found available slot: {slot_time.strftime('%Y-%m-%d %H:%M')} {self.timezone.zone}")
+                safe_log(logger.info, "Found available slot: %s %s", slot_time.strftime('%Y-%m-%d %H:%M'), self.timezone.key)
             
             current_date += timedelta(days=1)
             attempts += 1
         
         if len(available_slots) < num_videos:
-            safe_log(logger.warning, f"Could only find {len(available_slots)} available slots out of {num_videos} requested after searching {attempts} days")
+            safe_log(logger.warning, "Could only find %s available slots out of %s requested after searching %s days", len(available_slots), num_videos, attempts)
         else:
-            safe_log(logger.info, f"Found all {num_videos} required slots in {attempts} days")
+            safe_log(logger.info, "Found all %s required slots in %s days", num_videos, attempts)
         
         # Schedule videos to available slots
         scheduled_info = []
@@ -317,11 +399,10 @@ class ScheduleConfig:
             List[Dict]: List of dictionaries containing video_id, title, and scheduled_time
         """
         # Return cached results if available and not forcing refresh
-        current_time = datetime.now()
+        current_time = monotonic()
         if (not force_refresh and 
             self._scheduled_videos_cache is not None and 
-            self._last_fetch_time is not None and 
-            (current_time - self._last_fetch_time).total_seconds() < 300):  # Cache for 5 minutes
+            current_time - self._last_fetch_time < SCHEDULED_VIDEOS_CACHE_TTL):
             return self._scheduled_videos_cache
             
         if not self.youtube:
@@ -335,48 +416,72 @@ class ScheduleConfig:
             # Get channel's uploads playlist ID
             channel_response = self.youtube.channels().list(
                 part='contentDetails',
-                mine=True
+                mine=True,
+                fields='items(contentDetails/relatedPlaylists/uploads)'
             ).execute()
             
-            if not channel_response['items']:
+            if not channel_response.get('items'):
                 safe_log(logger.error, "No channel found")
                 return []
                 
             uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            safe_log(logger.info, f"Found uploads playlist ID: {uploads_playlist_id}")
-            
-            # Get video IDs from uploads playlist
-            playlist_items = self.youtube.playlistItems().list(
-                part='contentDetails',
-                playlistId=uploads_playlist_id,
-                maxResults=50
-            ).execute()
+            safe_log(logger.info, "Found uploads playlist ID: %s", uploads_playlist_id)
             
-            video_ids = [item['contentDetails']['videoId'] for item in playlist_items.get('items', [])]
-            safe_log(logger.info, f"Found {len(video_ids)} videos in uploads playlist")
-            safe_log(logger.debug, f"Uploads playlist video IDs: {video_ids}")
+            # Get video IDs from uploads playlist (newest first). Only videos published today or
+            # not published yet (scheduled/private, no videoPublishedAt) can matter, so skip older
+            # ones and stop paging at the first page that reaches back past today
+            today = datetime.now(self.timezone).date()
+            video_ids = []
+            page_token = None
+            for _ in range(UPLOADS_MAX_PAGES):
+                playlist_items = self.youtube.playlistItems().list(
+                    part='contentDetails',
+                    playlistId=uploads_playlist_id,
+                    maxResults=YOUTUBE_PAGE_SIZE,
+                    pageToken=page_token,
+                    fields='nextPageToken,items(contentDetails(videoId,videoPublishedAt))'
+                ).execute()
+                reached_older = False
+                for item in playlist_items.get('items', []):
+                    published_at = item['contentDetails'].get('videoPublishedAt')
+                    if published_at and datetime.fromisoformat(published_at.replace('Z', '+00:00')).astimezone(self.timezone).date() < today:
+                        reached_older = True
+                    else:
+                        video_ids.append(item['contentDetails']['videoId'])
+                page_token = playlist_items.get('nextPageToken')
+                if reached_older or not page_token:
+                    break
+            
+            safe_log(logger.info, "Found %s recent or unpublished videos in uploads playlist", len(video_ids))
+            safe_log(logger.debug, "Uploads playlist video IDs: %s", video_ids)
             
             if not video_ids:
-                safe_log(logger.warning, "No videos found in uploads playlist")
+                safe_log(logger.info, "No recent or unpublished videos found in uploads playlist")
+                self._scheduled_videos_cache = []
+                self._last_fetch_time = current_time
                 return []
             
-            # Get video details
-            videos_response = self.youtube.videos().list(
-                part='snippet,status',
-                id=','.join(video_ids)
-            ).execute()
+            # Get video details (partial response: only the fields read below),
+            # at most YOUTUBE_PAGE_SIZE ids per videos.list call
+            videos = []
+            for i in range(0, len(video_ids), YOUTUBE_PAGE_SIZE):
+                videos_response = self.youtube.videos().list(
+                    part='snippet,status',
+                    id=','.join(video_ids[i:i + YOUTUBE_PAGE_SIZE]),
+                    fields='items(id,snippet(title,publishedAt),status(privacyStatus,publishAt,uploadStatus))'
+                ).execute()
+                videos.extend(videos_response.get('items', []))
             
-            safe_log(logger.info, f"Retrieved details for {len(videos_response.get('items', []))} videos")
+            safe_log(logger.info, "Retrieved details for %s videos", len(videos))
             
             scheduled_videos = []
-            today = datetime.now(self.timezone).date()
             
-            for video in videos_response.get('items', []):
+            for video in videos:
                 # Debug logging for each video
                 debug_status = video['status'].get('privacyStatus')
                 debug_publish_at = video['status'].get('publishAt')
                 debug_upload_status = video['status'].get('uploadStatus')
-                safe_log(logger.debug, f"Checking video {video['id']} - privacy={debug_status}, publishAt={debug_publish_at}, uploadStatus={debug_upload_status}")
+                safe_log(logger.debug, "Checking video %s - privacy=%s, publishAt=%s, uploadStatus=%s", video['id'], debug_status, debug_publish_at, debug_upload_status)
                 
                 # Check for publishAt or publishedAt
                 video_time = None
@@ -398,9 +503,9 @@ class ScheduleConfig:
                             'upload_status': debug_upload_status,
                             'is_published': is_published
                         })
-                        safe_log(logger.debug, f"Added video: {video['id']} - {video['snippet']['title']} at {video_time} (Published: {is_published})")
+                        safe_log(logger.debug, "Added video: %s - %s at %s (Published: %s)", video['id'], video['snippet']['title'], video_time, is_published)
                 else:
-                    safe_log(logger.debug, f"Skipping video {video['id']} - no publish time")
+                    safe_log(logger.debug, "Skipping video %s - no publish time", video['id'])
             
             # Sort by scheduled time
             scheduled_videos.sort(key=lambda x: x['scheduled_time'])
@@ -415,16 +520,21 @@ class ScheduleConfig:
                 for video in scheduled_videos:
                     local_time = video['scheduled_time'].astimezone(self.timezone)
                     status = "Published" if video.get('is_published', False) else video['privacy_status']
-                    safe_log(logger.info, f"{local_time.strftime('%b %d, %H:%M')} - \"{video['title']}\" ({status}, {video['upload_status']})")
+                    safe_log(logger.info, "%s - \"%s\" (%s, %s)", local_time.strftime('%b %d, %H:%M'), video['title'], status, video['upload_status'])
             else:
                 safe_log(logger.info, "No scheduled videos found")
             
             return scheduled_videos
             
         except Exception as e:
-            safe_log(logger.error, f"Error fetching scheduled videos: {str(e)}")
+            safe_log(logger.error, "Error fetching scheduled videos: %s", e)
             return []
 
+    def invalidate_schedule_cache(self):
+        """Drop cached scheduled videos so the next fetch hits YouTube (e.g. after an upload)"""
+        self._scheduled_videos_cache = None
+        self._last_fetch_time = None
+
     def validate_schedule(self, schedule: List[datetime]) -> bool:
         """
         Validate if a schedule meets the requirements.
@@ -441,7 +551,7 @@ class ScheduleConfig:
             
         # Sort schedule to ensure chronological order
         schedule = sorted(schedule)
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(timezone.utc)
         
         # Filter out past times
         schedule = [s for s in schedule if s > now]
@@ -453,7 +563,7 @@ class ScheduleConfig:
         safe_log(logger.info, "\n=== Schedule Intervals ===")
         for i in range(1, len(schedule)):
             interval = (schedule[i] - schedule[i-1]).total_seconds() / 3600
-            safe_log(logger.info, f"Video {i}: {schedule[i-1]} → {schedule[i]} | Interval: {interval:.2f} hrs")
+            safe_log(logger.info, "Video %s: %s → %s | Interval: %.2f hrs", i, schedule[i-1], schedule[i], interval)
             
         # Check minimum interval between uploads
         for i in range(1, len(schedule)):
@@ -462,10 +572,10 @@ class ScheduleConfig:
             
             # Allow small negative intervals (up to 1 hour) due to timezone conversions
             if hours_diff < -1:
-                safe_log(logger.error, f"Invalid interval between uploads: {hours_diff:.1f} hours")
+                safe_log(logger.error, "Invalid interval between uploads: %.1f hours", hours_diff)
                 return False
             elif hours_diff < self.min_interval_hours:
-                safe_log(logger.warning, f"Interval between uploads ({hours_diff:.1f} hours) is less than minimum ({self.min_interval_hours} hours)")
+                safe_log(logger.warning, "Interval between uploads (%.1f hours) is less than minimum (%s hours)", hours_diff, self.min_interval_hours)
                 # Don't fail validation for this, just warn
         
         # Check maximum videos per week
@@ -481,7 +591,7 @@ class ScheduleConfig:
         # Check if any week has too many videos
         for week, count in videos_by_week.items():
             if count > self.max_videos_per_week:
-                safe_log(logger.error, f"Week starting {week} has {count} videos (max allowed: {self.max_videos_per_week})")
+                safe_log(logger.error, "Week starting %s has %s videos (max allowed: %s)", week, count, self.max_videos_per_week)
                 return False
             
         return True
@@ -498,11 +608,12 @@ class ScheduleConfig:
             raise ValueError(f"Invalid day: {day}")
         
         try:
-            new_time = datetime.strptime(time_str, '%H:%M').time()
-            self.daily_schedule[day.lower()] = new_time
-            self.save_config()
+            new_time = _parse_hhmm(time_str)
         except ValueError:
             raise ValueError(f"Invalid time format: {time_str}. Use HH:MM format.")
+        if self.daily_schedule[day.lower()] != new_time:
+            self.daily_schedule[day.lower()] = new_time
+            self.save_config()
 
     def set_timezone(self, timezone_str: str):
         """
@@ -512,10 +623,10 @@ class ScheduleConfig:
             timezone_str: Timezone string (e.g., 'Asia/Kolkata', 'America/New_York')
         """
         try:
-            self.timezone = pytz.timezone(timezone_str)
-            self.save_config()
-        except pytz.exceptions.UnknownTimeZoneError:
+            new_timezone = ZoneInfo(timezone_str)
+        except (ZoneInfoNotFoundError, ValueError):
             raise ValueError(f"Invalid timezone: {timezone_str}")
+        self._update_setting('timezone', new_timezone)
 
     def get_current_time(self) -> datetime:
         """Get current time in the configured timezone"""
@@ -525,22 +636,19 @@ class ScheduleConfig:
         """Update videos per day setting"""
         if count < 1:
             raise ValueError("Videos per day must be at least 1")
-        self.videos_per_day = count
-        self.save_config()
+        self._update_setting('videos_per_day', count)
 
     def set_min_interval(self, hours: int):
         """Update minimum interval between uploads"""
         if hours < 1:
             raise ValueError("Minimum interval must be at least 1 hour")
-        self.min_interval_hours = hours
-        self.save_config()
+        self._update_setting('min_interval_hours', hours)
 
     def set_max_videos_per_week(self, count: int):
         """Update maximum videos per week"""
         if count < 1:
             raise ValueError("Maximum videos per week must be at least 1")
-        self.max_videos_per_week = count
-        self.save_config()
+        self._update_setting('max_videos_per_week', count)
 
     def process_video(self, video_path: str, metadata: Optional[Dict] = None) -> bool:
         """
@@ -556,7 +664,7 @@ class ScheduleConfig:
         try:
             # Validate video file
             if not os.path.exists(video_path):
-                safe_log(logger.error, f"Video file not found: {video_path}")
+                safe_log(logger.error, "Video file not found: %s", video_path)
                 return False
                 
             # Get video metadata
@@ -568,7 +676,7 @@ class ScheduleConfig:
             
             # Add to processing queue
             self.processing_queue.append(metadata)
-            safe_log(logger.info, f"Added video to processing queue: {os.path.basename(video_path)}")
+            safe_log(logger.info, "Added video to processing queue: %s", os.path.basename(video_path))
             
             # Process queue if not already processing
             if not self.is_processing:
@@ -577,7 +685,7 @@ class ScheduleConfig:
             return True
             
         except Exception as e:
-            safe_log(logger.error, f"Error processing video: {str(e)}")
+            safe_log(logger.error, "Error processing video: %s", e)
             return False
             
     def process_queue(self):
@@ -594,21 +702,21 @@ class ScheduleConfig:
                 video_path = metadata.get('video_path')
                 
                 if not video_path or not os.path.exists(video_path):
-                    safe_log(logger.error, f"Invalid video path: {video_path}")
+                    safe_log(logger.error, "Invalid video path: %s", video_path)
                     continue
                     
                 # Process video
-                safe_log(logger.info, f"Processing video: {os.path.basename(video_path)}")
+                safe_log(logger.info, "Processing video: %s", os.path.basename(video_path))
                 
                 # Add to processed videos
                 self.processed_videos.append(metadata)
                 processed_count += 1
                 
         except Exception as e:
-            safe_log(logger.error, f"Error processing queue: {str(e)}")
+            safe_log(logger.error, "Error processing queue: %s", e)
             
         finally:
             self.is_processing = False
             if processed_count > 0:
-                safe_log(logger.info, f"Total videos processed: {processed_count}")
-                safe_log(logger.info, f"Successfully processed: {processed_count}") 
\ No newline at end of file
+                safe_log(logger.info, "Total videos processed: %s", processed_count)
+                safe_log(logger.info, "Successfully processed: %s", processed_count) 
\ No newline at end of file
@@ -1,9 +1,10 @@
 import os
+import re
 from pathlib import Path
 import subprocess
 import pysrt
 import json
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,42 @@ def parse_srt(srt_path: Path) -> List[Dict[str, Any]]:
     
     return segments
 
+SRT_TIMING_RE = re.compile(
+    r'(\d+):(\d\d):(\d\d)[,.](\d{1,3})\s*-->\s*(\d+):(\d\d):(\d\d)[,.](\d{1,3})'
+)
+SRT_BLOCK_SEPARATOR_RE = re.compile(r'\n[ \t]*\n')
+
+def _srt_time_ms(hours: str, minutes: str, seconds: str, millis: str) -> int:
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis.ljust(3, '0'))
+
+def parse_srt_cues(srt_path: Path) -> List[Tuple[int, int, str]]:
+    """
+    Parse an SRT file into plain (start_ms, end_ms, text) tuples.
+    
+    Lighter than pysrt for callers that only need timings and text: no per-cue
+    SubRipItem/SubRipTime objects are built.
+    
+    Args:
+        srt_path: Path to the SRT file
+        
+    Returns:
+        List of (start_ms, end_ms, text) tuples in file order
+    """
+    # One read() of the whole file and a single decode, rather than text-mode line buffering
+    with open(srt_path, 'rb') as f:
+        content = f.read().decode('utf-8-sig').replace('\r\n', '\n')
+    
+    cues = []
+    for block in SRT_BLOCK_SEPARATOR_RE.split(content):
+        lines = block.strip('\n').split('\n')
+        for i, line in enumerate(lines):
+            match = SRT_TIMING_RE.search(line)
+            if match:
+                groups = match.groups()
+                cues.append((_srt_time_ms(*groups[:4]), _srt_time_ms(*groups[4:]), '\n'.join(lines[i + 1:])))
+                break
+    return cues
+
 def find_clips_from_srt(
     srt_path: Path,
     keywords: List[str],
@@ -68,7 +105,12 @@ def find_clips_from_srt(
     # Get total video duration from the last segment
     total_duration = segments[-1]['end'] if segments else 0
     
-    def calculate_clip_score(clip_segments):
+    # Segments appear in many overlapping windows, so match the keywords against each one
+    # once, with a single alternation instead of a substring scan per keyword
+    keyword_re = re.compile('|'.join(re.escape(k.lower()) for k in keywords)) if keywords else None
+    keyword_hits = [bool(keyword_re and keyword_re.search(s['text'].lower())) for s in segments]
+    
+    def calculate_clip_score(clip_segments, keyword_matches):
         """Calculate a score for a potential clip based on its segments."""
         if not clip_segments:
             return 0
@@ -77,7 +119,6 @@ def find_clips_from_srt(
         avg_score = sum(s['score'] for s in clip_segments) / len(clip_segments)
         
         # Bonus for keyword matches
-        keyword_matches = sum(1 for s in clip_segments if any(k.lower() in s['text'].lower() for k in keywords))
         keyword_bonus = min(0.2, keyword_matches * 0.05)  # Up to 20% bonus for keywords
         
         return avg_score + keyword_bonus
@@ -105,6 +146,7 @@ def find_clips_from_srt(
     for start_idx in range(0, len(segments)):
         current_segments = []
         current_duration = 0
+        keyword_matches = 0
         
         # Build a clip starting from this segment
         for i in range(start_idx, len(segments)):
@@ -117,10 +159,11 @@ def find_clips_from_srt(
                 
             current_segments.append(segment)
             current_duration += segment_duration
+            keyword_matches += keyword_hits[i]
         
         # If we have enough segments, calculate score
         if current_segments and current_duration >= min_duration:
-            score = calculate_clip_score(current_segments)
+            score = calculate_clip_score(current_segments, keyword_matches)
             
             # Lower the threshold to create more clips
             if score > 0.3:  # Reduced from 0.5 to 0.3
@@ -211,8 +254,8 @@ def create_shorts_from_srt(
         output_path = output_dir / f"{prefix}_short_{i+1}.mp4"
         
         # Log clip number before processing
-        logger.info(f"Processing clip {i+1}/{len(clips)}: {output_path}")
-        logger.info(f"Clip score: {clip['score']:.2f}")
+        logger.info("Processing clip %s/%s: %s", i+1, len(clips), output_path)
+        logger.info("Clip score: %.2f", clip['score'])
         
         # Create the clip using FFmpeg
         try:
@@ -230,20 +273,20 @@ def create_shorts_from_srt(
             
             # Check if the created clip is too small (less than 1MB)
             if output_path.stat().st_size < 1024 * 1024:  # 1MB in bytes
-                logger.warning(f"Clip {i+1} is too small ({output_path.stat().st_size / 1024:.1f}KB), removing it")
+                logger.warning("Clip %s is too small (%.1fKB), removing it", i+1, output_path.stat().st_size / 1024)
                 output_path.unlink()
                 continue
                 
             clip_paths.append(output_path)
-            logger.info(f"Created clip: {output_path}")
+            logger.info("Created clip: %s", output_path)
             
         except subprocess.CalledProcessError as e:
-            logger.error(f"Error creating clip {i+1}: {e.stderr.decode()}")
+            logger.error("Error creating clip %s: %s", i+1, e.stderr.decode())
             continue
     
     # Log total number of shorts created
-    logger.info(f"Successfully created {len(clip_paths)} shorts from video: {video_name}")
+    logger.info("Successfully created %s shorts from video: %s", len(clip_paths), video_name)
     # Add a special completion message that will be caught by the formatter
-    logger.info(f"Completed: Step 2: Create shorts from full video (created {len(clip_paths)} shorts)")
+    logger.info("Completed: Step 2: Create shorts from full video (created %s shorts)", len(clip_paths))
     
     return clip_paths 
\ No newline at end of file
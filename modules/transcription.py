@@ -25,9 +25,6 @@ class TranscriptionHandler:
         options = Options(api_key=api_key)
         self.dg_client = Deepgram(options)
         
-        # Initialize AI transliterator
-        self.transliterator = AITransliterator()
-        
         # Load and normalize output folder from config
         config_path = project_root / "config" / "master_config.json"
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -315,7 +312,8 @@ class TranscriptionHandler:
         
         # Transliterate segments to Roman script using AI
         print("Transliterating Hindi text to Roman script using AI...")
-        transliterated_segments = self.transliterator.transliterate_text_segments(segments)
+        with AITransliterator() as transliterator:
+            transliterated_segments = transliterator.transliterate_text_segments(segments)
         
         # Save transliterated SRT file
         with open(path, 'w', encoding='utf-8') as f:
@@ -212,7 +212,7 @@ def upload_with_schedule(video_path, title, description, tags, thumbnail_path=No
                 publish_time = current_time + datetime.timedelta(days=1)
         
         # Use the existing upload function with the calculated publish time
-        return upload_to_youtube(
+        video_id = upload_to_youtube(
             video_path=video_path,
             title=title,
             description=description,
@@ -220,6 +220,12 @@ def upload_with_schedule(video_path, title, description, tags, thumbnail_path=No
             thumbnail_path=thumbnail_path,
             publish_time=publish_time
         )
+        
+        # The slot is taken now, so the next get_next_publish_time must refetch
+        if schedule_config and video_id:
+            schedule_config.invalidate_schedule_cache()
+        
+        return video_id
     except Exception as e:
         print(f"An error occurred during scheduled upload: {str(e)}")
         return None
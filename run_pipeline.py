@@ -1,12 +1,19 @@
 import subprocess
 import sys
 import os
+import signal
+import threading
+import time
 import logging
 import json
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 import re
 
+from config.paths import get_config_paths
+
 # Set up logging with UTF-8 encoding and emojis
 class EmojiFormatter(logging.Formatter):
     # ANSI color codes
@@ -20,6 +27,18 @@ class EmojiFormatter(logging.Formatter):
     }
 
     def format(self, record):
+        # Decorate a copy of the message only: the same record is formatted by every
+        # handler (and by RotatingFileHandler's rollover check), so don't stack emojis
+        original_msg, original_args = record.msg, record.args
+        # Match on the final text: lazy %-style calls keep the step names in record.args
+        record.msg = record.getMessage()
+        record.args = None
+        try:
+            return self._format_with_emojis(record)
+        finally:
+            record.msg, record.args = original_msg, original_args
+
+    def _format_with_emojis(self, record):
         # Skip adding emojis for separator lines
         if "⏳" in record.msg or "♻️" in record.msg or "⭐" in record.msg:
             return super().format(record)
@@ -114,22 +133,40 @@ class EmojiFormatter(logging.Formatter):
                     record.msg = f"📤  {record.msg}"  # Uploading
         return super().format(record)
 
-# Set up logging with UTF-8 encoding
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('pipeline.log', encoding='utf-8')
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_FILE = 'pipeline.log'
+LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate pipeline.log so it cannot grow without bound
+LOG_BACKUP_COUNT = 3
 
-# Apply the emoji formatter to the root logger
-for handler in logging.getLogger().handlers:
-    handler.setFormatter(EmojiFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+def setup_logging():
+    """Attach the stdout and pipeline.log handlers with the emoji formatter.
+
+    Safe to call repeatedly from a long-lived process (e.g. the Celery worker):
+    any existing pipeline.log handler is replaced so a log file cleared between
+    runs is reopened instead of writing to the unlinked inode.
+    """
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    
+    log_path = os.path.abspath(LOG_FILE)
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.FileHandler) and handler.baseFilename == log_path:
+            root_logger.removeHandler(handler)
+            handler.close()
+    
+    if not any(type(handler) is logging.StreamHandler for handler in root_logger.handlers):
+        root_logger.addHandler(logging.StreamHandler(sys.stdout))
+    root_logger.addHandler(RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'))
+    
+    # Apply the emoji formatter to the root logger
+    for handler in root_logger.handlers:
+        handler.setFormatter(EmojiFormatter(LOG_FORMAT))
 
 logger = logging.getLogger(__name__)
 
+class PipelineError(Exception):
+    """Raised when one or more videos fail to go through the pipeline"""
+
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.absolute()
 
@@ -152,11 +189,14 @@ def get_pipeline_config():
         logger.error("Error: Invalid JSON in master_config.json!")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Error reading master_config.json: {str(e)}")
+        logger.error("Error reading master_config.json: %s", e)
         sys.exit(1)
 
 def normalize_paths_in_config():
-    """Normalize paths in master_config.json based on environment"""
+    """
+    Make master_config.json's folders match get_config_paths(), which the web app and the
+    worker also use, so the pipeline steps read and write the same folders they do.
+    """
     config_path = PROJECT_ROOT / "config" / "master_config.json"
     if not config_path.exists():
         logger.error("Error: master_config.json not found in config directory!")
@@ -167,10 +207,11 @@ def normalize_paths_in_config():
         with open(config_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
         
-        # Use Hostinger KVM 2 paths
-        config['input_folder'] = '/opt/video-automation/input'
-        config['output_folder'] = '/opt/video-automation/output'
-        logger.info("🖥️ Running on Hostinger KVM 2 - using Hostinger paths in config")
+        input_folder, output_folder = get_config_paths()
+        if config.get('input_folder') == input_folder and config.get('output_folder') == output_folder:
+            return
+        config['input_folder'] = input_folder
+        config['output_folder'] = output_folder
         
         # Write back the normalized config
         with open(config_path, 'w', encoding='utf-8') as f:
@@ -178,59 +219,79 @@ def normalize_paths_in_config():
         
         logger.info("Normalized paths in master_config.json")
     except Exception as e:
-        logger.error(f"Error normalizing paths in master_config.json: {str(e)}")
+        logger.error("Error normalizing paths in master_config.json: %s", e)
         sys.exit(1)
 
 def get_all_videos(folder_path: Path) -> list[Path]:
     """Get all video files from the specified folder"""
     if not folder_path.exists():
-        logger.error(f"Error: Input folder '{folder_path}' not found!")
+        logger.error("Error: Input folder '%s' not found!", folder_path)
         sys.exit(1)
     
     # Supported video formats (case-insensitive)
     video_extensions = ['.mp4', '.mov', '.avi', '.mkv']
     
-    # Get all video files in the folder (case-insensitive)
-    video_files = []
-    for file_path in folder_path.iterdir():
-        if file_path.is_file():
-            file_ext = file_path.suffix.lower()
-            if file_ext in video_extensions:
-                video_files.append(file_path)
+    # Get all video files in the folder (case-insensitive); scandir gives the file type
+    # without a stat, and each entry's stat() result is cached for the sort below
+    with os.scandir(folder_path) as it:
+        entries = [
+            entry for entry in it
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in video_extensions
+        ]
     
-    if not video_files:
-        logger.error(f"Error: No video files found in '{folder_path}'!")
+    if not entries:
+        logger.error("Error: No video files found in '%s'!", folder_path)
         # List all files in the directory for debugging
         all_files = list(folder_path.iterdir())
         if all_files:
-            logger.info(f"Files found in directory: {[f.name for f in all_files]}")
+            logger.info("Files found in directory: %s", [f.name for f in all_files])
         else:
             logger.info("Directory is empty")
         sys.exit(1)
     
     # Sort by modification time
-    video_files.sort(key=lambda x: x.stat().st_mtime)
-    logger.info(f"Found {len(video_files)} video files: {[f.name for f in video_files]}")
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    video_files = [Path(entry.path) for entry in entries]
+    logger.info("Found %s video files: %s", len(video_files), [f.name for f in video_files])
     return video_files
 
-def run_command(command: str, step_name: str) -> bool:
-    """Run a command and log its output"""
-    logger.info(f"Starting: {step_name}")
+def kill_process_group(process: subprocess.Popen):
+    """Kill a step's shell together with the python/ffmpeg children it started"""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass  # Already exited
+
+def run_command(command: str, step_name: str, deadline: Optional[float] = None) -> bool:
+    """Run a command and log its output, killing it if it is still running at the deadline"""
+    logger.info("Starting: %s", step_name)
+    process = None
+    watchdog = None
     try:
         # Set up environment with PYTHONPATH
         env = os.environ.copy()
         env['PYTHONPATH'] = str(PROJECT_ROOT)
         
         # Run the command and capture output in real-time
+        # (in its own session so the whole process group can be killed on timeout)
         process = subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             universal_newlines=True,
             shell=True,
-            env=env
+            env=env,
+            start_new_session=True
         )
         
+        if deadline is not None:
+            watchdog = threading.Timer(max(0.0, deadline - time.monotonic()), kill_process_group, args=(process,))
+            watchdog.daemon = True
+            watchdog.start()
+        
         # Stream the output in real-time
         for line in process.stdout:
             # Remove any ANSI color codes and extra whitespace
@@ -241,20 +302,36 @@ def run_command(command: str, step_name: str) -> bool:
         # Wait for the process to complete
         return_code = process.wait()
         
-        if return_code == 0:
-            logger.info(f"Completed: {step_name}")
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.error("Failed: %s exceeded the pipeline deadline", step_name)
+            return False
+        elif return_code == 0:
+            logger.info("Completed: %s", step_name)
             return True
         else:
-            logger.error(f"Failed: {step_name} with return code {return_code}")
+            logger.error("Failed: %s with return code %s", step_name, return_code)
             return False
             
     except Exception as e:
-        logger.error(f"Error in {step_name}: {str(e)}")
+        logger.error("Error in %s: %s", step_name, e)
         return False
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+        # Don't leave ffmpeg running if we were interrupted (e.g. Celery soft time limit)
+        if process is not None and process.poll() is None:
+            kill_process_group(process)
 
-def process_video(video_file: Path, config: dict) -> bool:
-    """Process a single video through the pipeline"""
-    logger.info(f"Processing video: {video_file}")
+def process_video(video_file: Path, config: dict, deadline: Optional[float] = None) -> Optional[Path]:
+    """
+    Process a single video through the pipeline and return the subtitled output path.
+    
+    Args:
+        video_file: Video to process
+        config: Parsed master_config.json
+        deadline: Optional time.monotonic() value after which remaining steps are abandoned
+    """
+    logger.info("Processing video: %s", video_file)
     
     # Construct the path to the subtitled video
     output_root = Path(config['output_folder']).expanduser().resolve()
@@ -293,15 +370,19 @@ def process_video(video_file: Path, config: dict) -> bool:
     for step in steps:
         # Check if the step is enabled in config
         if not config['pipeline_steps'].get(step['config_key'], False):
-            logger.info(f"{step['name']} is disabled in config. Stopping pipeline.")
-            return True  # Return True since this is an intentional stop
+            logger.info("%s is disabled in config. Stopping pipeline.", step['name'])
+            return subtitled_video_path  # Intentional stop still counts as success
+        
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.error("Pipeline deadline passed before %s for video %s", step['name'], video_file)
+            return None
             
-        if not run_command(step["command"], step["name"]):
-            logger.error(f"Pipeline failed at {step['name']} for video {video_file}")
-            return False
+        if not run_command(step["command"], step["name"], deadline):
+            logger.error("Pipeline failed at %s for video %s", step['name'], video_file)
+            return None
 
-    logger.info(f"Successfully processed video: {video_file}")
-    return True
+    logger.info("Successfully processed video: %s", video_file)
+    return subtitled_video_path
 
 def display_final_metadata_summary(config: dict):
     """Display final metadata summary from shorts_titles.json"""
@@ -319,62 +400,87 @@ def display_final_metadata_summary(config: dict):
                     video_id = info.get('youtube_id', 'Unknown')
                     title = info.get('title', 'No title')
                     upload_date = info.get('upload_date', 'Unknown')
-                    logger.info(f"🎥  Video ID: {video_id}")
-                    logger.info(f"📝  Title: {title}")
-                    logger.info(f"📅  Upload Date: {upload_date}")
+                    logger.info("🎥  Video ID: %s", video_id)
+                    logger.info("📝  Title: %s", title)
+                    logger.info("📅  Upload Date: %s", upload_date)
                     logger.info("---")
     except Exception as e:
-        logger.error(f"Error reading final metadata: {str(e)}")
+        logger.error("Error reading final metadata: %s", e)
 
-def main():
+def main(input_path: Optional[str] = None, deadline: Optional[float] = None) -> Optional[Path]:
+    """
+    Run the pipeline over a single video or every video in the input folder.
+    
+    Args:
+        input_path: Optional path to one video; defaults to all videos in input_folder
+        deadline: Optional time.monotonic() value after which running steps are killed
+        
+    Returns:
+        Path of the subtitled output video for the last successfully processed input
+        
+    Raises:
+        PipelineError: If any video failed to process
+    """
+    setup_logging()
+    
     # Normalize paths in master_config.json first
     normalize_paths_in_config()
     
     # Get configuration
     config = get_pipeline_config()
     
-    # Get input folder from config and find all videos
-    input_folder = Path(config['input_folder']).expanduser().resolve()
-    video_files = get_all_videos(input_folder)
+    if input_path:
+        video_files = [Path(input_path).expanduser().resolve()]
+    else:
+        # Get input folder from config and find all videos
+        input_folder = Path(config['input_folder']).expanduser().resolve()
+        video_files = get_all_videos(input_folder)
     
     # Track success and failure
     successful_videos = []
     failed_videos = []
+    output_path = None
     
     # Process each video
     for video_file in video_files:
         # Add visual separator for new video
         logger.info("♻️ ♻️ ♻️  Processing new video  ♻️ ♻️ ♻️")
-        logger.info(f"🎥  {video_file}")
+        logger.info("🎥  %s", video_file)
         logger.info("⏳ ⏳ ⏳  Starting processing  ⏳ ⏳ ⏳")
         
         try:
-            if process_video(video_file, config):
+            video_output = process_video(video_file, config, deadline)
+            if video_output:
                 successful_videos.append(video_file)
+                output_path = video_output
             else:
                 failed_videos.append(video_file)
         except Exception as e:
-            logger.error(f"Unexpected error processing video {video_file}: {str(e)}")
+            logger.error("Unexpected error processing video %s: %s", video_file, e)
             failed_videos.append(video_file)
     
     # Print summary
     logger.info("⏳ ⏳ ⏳  Pipeline Summary  ⏳ ⏳ ⏳")
-    logger.info(f"📊  Total videos processed: {len(video_files)}")
-    logger.info(f"✅  Successfully processed: {len(successful_videos)}")
-    logger.info(f"❌  Failed to process: {len(failed_videos)}")
+    logger.info("📊  Total videos processed: %s", len(video_files))
+    logger.info("✅  Successfully processed: %s", len(successful_videos))
+    logger.info("❌  Failed to process: %s", len(failed_videos))
     
     if failed_videos:
         logger.info("\nFailed videos:")
         for video in failed_videos:
-            logger.info(f"- {video}")
+            logger.info("- %s", video)
     
     # Display final metadata summary
     display_final_metadata_summary(config)
     
     if failed_videos:
-        sys.exit(1)  # Exit with error if any videos failed
-    else:
-        logger.info("⭐  All videos processed successfully!")
+        raise PipelineError(f"{len(failed_videos)} of {len(video_files)} videos failed to process")
+    
+    logger.info("⭐  All videos processed successfully!")
+    return output_path
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except PipelineError:
+        sys.exit(1)  # Exit with error if any videos failed
@@ -46,7 +46,7 @@ def main():
         logger.info("Generating transcription and scoring data...")
         handler = TranscriptionHandler()
         srt_path = handler.transcribe_video(video_path)
-        logger.info(f"Generated transcription and scoring data: {srt_path}")
+        logger.info("Generated transcription and scoring data: %s", srt_path)
 
     # Keywords to look for in subtitles
     keywords = [
@@ -68,9 +68,9 @@ def main():
     )
 
     if clip_paths:
-        logger.info(f"Successfully created {len(clip_paths)} shorts")
+        logger.info("Successfully created %s shorts", len(clip_paths))
         for path in clip_paths:
-            logger.info(f"Created short: {path}")
+            logger.info("Created short: %s", path)
     else:
         logger.warning("No shorts were created")
 
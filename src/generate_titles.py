@@ -4,9 +4,17 @@ Script to generate YouTube titles for shorts videos using their subtitle content
 import os
 import json
 import sys
+import hashlib
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Tuple
-import pysrt
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
@@ -14,11 +22,50 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from modules.title_generator import TitleGenerator
-from modules.subtitle_clipper import parse_srt, find_clips_from_srt
+from modules.subtitle_clipper import parse_srt_cues
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Concurrent OpenRouter requests while titling the shorts of one video
+TITLE_GENERATION_WORKERS = int(os.environ.get('TITLE_GENERATION_WORKERS', 4))
+
+# Part of every title cache key; bump it when the TitleGenerator prompt or model changes
+TITLE_CACHE_VERSION = "1"
+
+# Most recent titles kept in .title_cache.json; older entries are dropped on save
+TITLE_CACHE_MAX_ENTRIES = int(os.environ.get('TITLE_CACHE_MAX_ENTRIES', 5000))
+
+def write_json(path: Path, data, indent: bool = True):
+    """Write data as UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+class SubtitleIndex:
+    """Subtitle cues sorted by start time, for range queries by bisection"""
+
+    def __init__(self, cues: List[Tuple[int, int, str]]):
+        """
+        Args:
+            cues: (start_ms, end_ms, text) tuples
+        """
+        cues = sorted(cues, key=lambda cue: cue[0])
+        self.starts = [start for start, _, _ in cues]
+        self.ends = [end for _, end, _ in cues]
+        self.texts = [text for _, _, text in cues]
+        # Running maximum of the end times: cues before the first entry >= t all end before t
+        self.max_ends = list(accumulate(self.ends, max))
+
+    def texts_between(self, start_ms: float, end_ms: float) -> List[str]:
+        """Texts of the cues overlapping [start_ms, end_ms], in start order"""
+        lo = bisect_left(self.max_ends, start_ms)
+        hi = bisect_right(self.starts, end_ms)
+        return [self.texts[i] for i in range(lo, hi) if self.ends[i] >= start_ms]
+
 class ShortsTitleGenerator:
     def __init__(self):
         """Initialize the title generator with paths"""
@@ -43,26 +90,65 @@ class ShortsTitleGenerator:
         
         self.metadata_dir = self.output_root / "metadata"
         self.metadata_dir.mkdir(exist_ok=True)
+        
+        # Generated titles keyed by a hash of the subtitle snippet, kept across runs
+        self.title_cache_file = self.output_root / ".title_cache.json"
+        self.title_cache = {}
+        if self.title_cache_file.exists():
+            try:
+                with open(self.title_cache_file, 'r', encoding='utf-8') as f:
+                    title_cache = json.load(f)
+                if isinstance(title_cache, dict):
+                    self.title_cache = title_cache
+                else:
+                    logger.warning("Title cache is not a JSON object, starting fresh")
+            except (OSError, ValueError) as e:
+                logger.warning("Could not load title cache, starting fresh: %s", e)
+        self._title_cache_lock = threading.Lock()
+        
+        # Parsed subtitle index per SRT path, reused across the shorts of a video
+        self._srt_cache: Dict[str, Tuple[int, "SubtitleIndex"]] = {}
 
     def safe_encode(self, text: str) -> str:
         """Safely encode text for logging"""
         return text.encode('utf-8', errors='replace').decode('utf-8')
 
+    def load_subtitle_index(self, subtitle_path: Path) -> "SubtitleIndex":
+        """Parse and index an SRT file, once per file version"""
+        key = str(subtitle_path)
+        mtime = os.stat(key).st_mtime_ns
+        cached = self._srt_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        index = SubtitleIndex(parse_srt_cues(key))
+        self._srt_cache[key] = (mtime, index)
+        return index
+
     def get_subtitle_content_for_timestamps(self, subtitle_path: Path, start_time: float, end_time: float) -> str:
         """Get subtitle content for a specific time range"""
         try:
-            subs = pysrt.open(str(subtitle_path))
-            content = []
-            for sub in subs:
-                sub_start = sub.start.ordinal / 1000
-                sub_end = sub.end.ordinal / 1000
-                if sub_start <= end_time and sub_end >= start_time:
-                    content.append(sub.text)
-            return " ".join(content)
+            return " ".join(self.load_subtitle_index(subtitle_path).texts_between(start_time * 1000, end_time * 1000))
         except Exception as e:
-            logger.error(f"Error reading subtitles: {str(e)}")
+            logger.error("Error reading subtitles: %s", e)
             return ""
 
+    def title_cache_key(self, subtitle_content: str) -> str:
+        """Cache key for a subtitle snippet"""
+        data = f"{TITLE_CACHE_VERSION}\0{subtitle_content}".encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def save_title_cache(self):
+        """Write the newest TITLE_CACHE_MAX_ENTRIES titles to disk atomically"""
+        with self._title_cache_lock:
+            if len(self.title_cache) > TITLE_CACHE_MAX_ENTRIES:
+                # Dicts keep insertion order, so the oldest titles come first
+                self.title_cache = dict(list(self.title_cache.items())[-TITLE_CACHE_MAX_ENTRIES:])
+            snapshot = dict(self.title_cache)
+        tmp_file = self.title_cache_file.with_suffix('.tmp')
+        write_json(tmp_file, snapshot, indent=False)
+        os.replace(tmp_file, self.title_cache_file)
+
     def save_metadata(self, video_path: Path, title: str, hashtags: List[str], description: str, index: int, video_name: str):
         """Save metadata for a single short"""
         # Strip quotes from title and description
@@ -80,9 +166,8 @@ class ShortsTitleGenerator:
         
         # Create a unique filename using video name and index
         metadata_file = self.metadata_dir / f"{video_name}_short_{index+1}.json"
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved metadata to {metadata_file}")
+        write_json(metadata_file, metadata)
+        logger.info("Saved metadata to %s", metadata_file)
 
     def generate_title_for_video(self, video_path: Path, subtitle_path: Path, start_time: float, end_time: float, clip_number: int = 0, total_clips: int = 0) -> Tuple[str, List[str], str]:
         """Generate title, hashtags, and description for a single video using its corresponding subtitle content"""
@@ -95,10 +180,20 @@ class ShortsTitleGenerator:
             print(f"Error: No subtitle content found for {video_path} between {start_time}s and {end_time}s")
             return "", [], ""
 
+        # Reuse the title generated for the same snippet on an earlier run
+        cache_key = self.title_cache_key(subtitle_content)
+        cached = self.title_cache.get(cache_key)
+        if isinstance(cached, list) and len(cached) == 3:
+            title, hashtags, description = cached
+            print(f"Using cached title: {self.safe_encode(title)}")
+            return title, hashtags, description
+
         # Generate title, hashtags, and description using the subtitle content
         result = self.title_generator.generate_title_and_hashtags(subtitle_content)
         if result:
             title, hashtags, description = result
+            with self._title_cache_lock:
+                self.title_cache[cache_key] = [title, hashtags, description]
             safe_title = self.safe_encode(title)
             print(f"Generated title: {safe_title}")
             print(f"Generated hashtags: {' '.join(hashtags)}")
@@ -157,8 +252,9 @@ class ShortsTitleGenerator:
             print(f"Error: No segments found in scoring data")
             return
         
-        # Process each video with its corresponding timestamp
-        for i, video_file in enumerate(video_files):
+        # Pair each video with its corresponding timestamp
+        jobs = []
+        for video_file in video_files:
             # Get the clip number from the filename
             try:
                 clip_num = int(video_file.stem.split('_')[-1]) - 1  # Convert to 0-based index
@@ -168,25 +264,44 @@ class ShortsTitleGenerator:
             
             # Find the corresponding segment in the scoring data
             if clip_num < len(segments):
-                segment = segments[clip_num]
-                # Generate title, hashtags, and description using the corresponding subtitle content
-                title, hashtags, description = self.generate_title_for_video(
-                    video_file, 
-                    subtitles_dir / f"{video_name}.srt", 
-                    segment['start'], 
-                    segment['end'],
-                    clip_num + 1,  # Clip number (1-based)
-                    total_clips  # Total number of clips
-                )
+                jobs.append((video_file, segments[clip_num], clip_num))
+            else:
+                print(f"Warning: No scoring data found for clip {clip_num + 1}, skipping title generation")
+        
+        # Each title is a remote LLM round-trip, so request them concurrently
+        subtitle_path = subtitles_dir / f"{video_name}.srt"
+        with ThreadPoolExecutor(max_workers=TITLE_GENERATION_WORKERS) as executor:
+            # Shorts with identical subtitle text share one request
+            futures_by_content = {}
+            futures = []
+            for video_file, segment, clip_num in jobs:
+                content = self.get_subtitle_content_for_timestamps(subtitle_path, segment['start'], segment['end'])
+                future = futures_by_content.get(content)
+                if future is None:
+                    future = futures_by_content[content] = executor.submit(
+                        self.generate_title_for_video,
+                        video_file,
+                        subtitle_path,
+                        segment['start'],
+                        segment['end'],
+                        clip_num + 1,  # Clip number (1-based)
+                        total_clips  # Total number of clips
+                    )
+                else:
+                    print(f"Reusing title request for {video_file.name}: same subtitles as an earlier clip")
+                futures.append(future)
+            
+            # Record results in clip order
+            for (video_file, _, clip_num), future in zip(jobs, futures):
+                title, hashtags, description = future.result()
                 if title:
                     self.titles[str(video_file)] = (title, hashtags, description)
                     # Save metadata for this short with unique filename
                     self.save_metadata(video_file, title, hashtags, description, clip_num, video_name)
-            else:
-                print(f"Warning: No scoring data found for clip {clip_num + 1}, skipping title generation")
 
         # Save titles to JSON file
         self.save_titles()
+        self.save_title_cache()
 
     def save_titles(self):
         """Save generated titles, hashtags, and descriptions to a JSON file"""
@@ -231,9 +346,15 @@ class ShortsTitleGenerator:
                 data["youtube_id"] = existing_titles[path].get("youtube_id")
                 existing_titles[path] = data
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(existing_titles, f, indent=2, ensure_ascii=False)
-        logger.info(f"\nTitles, hashtags, and descriptions saved to {output_file}")
+        write_json(output_file, existing_titles)
+        logger.info("\nTitles, hashtags, and descriptions saved to %s", output_file)
+
+def find_videos_newest_first(directory: Path, suffix: str) -> List[Path]:
+    """List files in a directory ending with suffix, newest first, with one scandir pass"""
+    with os.scandir(directory) as it:
+        entries = [entry for entry in it if entry.name.endswith(suffix) and entry.is_file()]
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    return [Path(entry.path) for entry in entries]
 
 def main():
     """Main function to generate titles for all shorts"""
@@ -247,21 +368,13 @@ def main():
             raise FileNotFoundError(f"Processed directory not found: {processed_dir}")
             
         # Get all processed videos sorted by modification time
-        video_files = sorted(
-            processed_dir.glob("*_with_subs_trimmed.mp4"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
+        video_files = find_videos_newest_first(processed_dir, "_with_subs_trimmed.mp4")
         
         if not video_files:
             print(f"Warning: No processed videos found in {processed_dir}")
             print("Checking for videos in output directory...")
             # Try looking in the output directory directly
-            video_files = sorted(
-                generator.output_root.glob("*_with_subs_trimmed.mp4"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            video_files = find_videos_newest_first(generator.output_root, "_with_subs_trimmed.mp4")
             if not video_files:
                 raise FileNotFoundError(f"No processed videos found in {generator.output_root}")
             
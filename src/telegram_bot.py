@@ -51,7 +51,7 @@ if not BOT_TOKEN:
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
-    logger.info(f"User {user.id} ({user.username}) started the bot.")
+    logger.info("User %s (%s) started the bot.", user.id, user.username)
     # Create inline keyboard with Dropbox upload link
     keyboard = [
         [InlineKeyboardButton("📤 Upload", url="https://drive.google.com/drive/folders/1OK3RL0Zh7CxaxJs8WkFYMp12WE7JEw1H?usp=drive_link")]
@@ -69,14 +69,14 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def done_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
-    logger.info(f"User {user.id} ({user.username}) used the /done command.")
+    logger.info("User %s (%s) used the /done command.", user.id, user.username)
     await update.message.reply_text("⚙️ Your video is being processed, you will hear from us shortly!")
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Log any text message sent by the user."""
     user = update.effective_user
     message_text = update.message.text
-    logger.info(f"User {user.id} ({user.username}) sent message: \"{message_text}\"")
+    logger.info("User %s (%s) sent message: \"%s\"", user.id, user.username, message_text)
 
 async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
@@ -87,7 +87,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     callback_data = query.data
     
     if callback_data == "done":
-        logger.info(f"User {user.id} ({user.username}) clicked the 'Done' button.")
+        logger.info("User %s (%s) clicked the 'Done' button.", user.id, user.username)
         await query.edit_message_text("⚙️ Your video is being processed, you will hear from us shortly!")
 
 def main():
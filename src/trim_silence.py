@@ -31,10 +31,10 @@ def main():
     video_path = Path(sys.argv[1])
     
     if not video_path.exists():
-        logger.error(f"Video file not found: {video_path}")
+        logger.error("Video file not found: %s", video_path)
         sys.exit(1)
 
-    logger.info(f"Processing video: {video_path}")
+    logger.info("Processing video: %s", video_path)
 
     # Initialize silence trimmer
     trimmer = SilenceTrimmer()
@@ -43,7 +43,7 @@ def main():
     output_path = trimmer.process_video(str(video_path))
     
     if output_path:
-        logger.info(f"Successfully created trimmed video: {output_path}")
+        logger.info("Successfully created trimmed video: %s", output_path)
         # Add a special completion message that will be caught by the formatter
         logger.info("Completed: Step 1.5: Trim silence from video")
     else:
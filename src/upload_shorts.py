@@ -39,13 +39,13 @@ def get_authenticated_service():
             credentials.refresh(Request())
         else:
             if not CLIENT_SECRETS_FILE.exists():
-                logger.error(f"Error: {CLIENT_SECRETS_FILE} not found!")
+                logger.error("Error: %s not found!", CLIENT_SECRETS_FILE)
                 logger.error("Please follow these steps:")
                 logger.error("1. Go to Google Cloud Console")
                 logger.error("2. Create a project and enable YouTube Data API")
                 logger.error("3. Configure OAuth consent screen")
                 logger.error("4. Create OAuth 2.0 credentials")
-                logger.error(f"5. Download and place in {CLIENT_SECRETS_FILE}")
+                logger.error("5. Download and place in %s", CLIENT_SECRETS_FILE)
                 sys.exit(1)
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(CLIENT_SECRETS_FILE), SCOPES)
@@ -71,18 +71,18 @@ def load_titles():
         # Try to load from output directory
         titles_file = output_folder / "shorts_titles.json"
         if not titles_file.exists():
-            logger.warning(f"shorts_titles.json not found at {titles_file}")
+            logger.warning("shorts_titles.json not found at %s", titles_file)
             return {}
         
         with open(titles_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            logger.info(f"Successfully loaded metadata for {len(data)} videos from {titles_file}")
+            logger.info("Successfully loaded metadata for %s videos from %s", len(data), titles_file)
             
             # Validate metadata structure and clean up quotes
             valid_data = {}
             for path, info in data.items():
                 if not isinstance(info, dict):
-                    logger.warning(f"Invalid metadata format for {path}, skipping")
+                    logger.warning("Invalid metadata format for %s, skipping", path)
                     continue
                     
                 # Clean up quotes from title and description
@@ -97,32 +97,32 @@ def load_titles():
                 
                 # Ensure all required fields exist
                 if not info.get('title'):
-                    logger.warning(f"No title found for {path}, using filename as title")
+                    logger.warning("No title found for %s, using filename as title", path)
                     info['title'] = Path(path).stem
                 
                 if not info.get('hashtags'):
-                    logger.warning(f"No hashtags found for {path}, using default hashtags")
+                    logger.warning("No hashtags found for %s, using default hashtags", path)
                     info['hashtags'] = ["shorts", "viral"]
                 
                 if not info.get('description'):
-                    logger.warning(f"No description found for {path}, using default description")
+                    logger.warning("No description found for %s, using default description", path)
                     info['description'] = f"Check out this amazing short video! {info['title']}"
                 
                 valid_data[path] = info
             
             # Log sample metadata for debugging
             for path, info in list(valid_data.items())[:3]:
-                logger.info(f"Sample metadata for {path}:")
-                logger.info(f"  Title: {info.get('title', 'No title')}")
-                logger.info(f"  Hashtags: {info.get('hashtags', [])}")
-                logger.info(f"  Description: {info.get('description', 'No description')[:100]}...")
+                logger.info("Sample metadata for %s:", path)
+                logger.info("  Title: %s", info.get('title', 'No title'))
+                logger.info("  Hashtags: %s", info.get('hashtags', []))
+                logger.info("  Description: %s...", info.get('description', 'No description')[:100])
             
             return valid_data
     except json.JSONDecodeError:
-        logger.error(f"Error parsing {titles_file}. Using default titles.")
+        logger.error("Error parsing %s. Using default titles.", titles_file)
         return {}
     except Exception as e:
-        logger.error(f"Error loading titles: {str(e)}")
+        logger.error("Error loading titles: %s", e)
         return {}
 
 def normalize_path(path: str) -> str:
@@ -145,7 +145,7 @@ def normalize_path(path: str) -> str:
             return abs_path.name
             
     except Exception as e:
-        logger.error(f"Error normalizing path {path}: {str(e)}")
+        logger.error("Error normalizing path %s: %s", path, e)
         return str(Path(path).name)  # Fallback to just the filename
 
 def get_schedule_for_videos_with_limit(config, video_files, max_videos_per_week=7):
@@ -210,9 +210,9 @@ def update_upload_status(video_path: str, video_id: str):
                 
                 with open(titles_path, 'w', encoding='utf-8') as f:
                     json.dump(titles, f, indent=2, ensure_ascii=False)
-                logger.info(f"Updated upload status in shorts_titles.json for {video_path}")
+                logger.info("Updated upload status in shorts_titles.json for %s", video_path)
         except Exception as e:
-            logger.error(f"Error updating shorts_titles.json: {str(e)}")
+            logger.error("Error updating shorts_titles.json: %s", e)
 
     # Update metadata file
     try:
@@ -231,9 +231,9 @@ def update_upload_status(video_path: str, video_id: str):
             
             with open(metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
-            logger.info(f"Updated upload status in metadata file for {video_path}")
+            logger.info("Updated upload status in metadata file for %s", video_path)
     except Exception as e:
-        logger.error(f"Error updating metadata file: {str(e)}")
+        logger.error("Error updating metadata file: %s", e)
 
 def upload_with_schedule(video_path: str, title: str, description: str, tags: List[str], schedule_config: ScheduleConfig, schedule_time: datetime) -> Optional[str]:
     """Upload a video to YouTube with scheduling."""
@@ -263,7 +263,7 @@ def upload_with_schedule(video_path: str, title: str, description: str, tags: Li
         }
         
         # Upload video
-        logger.info(f"Uploading video: {title}")
+        logger.info("Uploading video: %s", title)
         request = youtube.videos().insert(
             part=','.join(body.keys()),
             body=body,
@@ -274,15 +274,17 @@ def upload_with_schedule(video_path: str, title: str, description: str, tags: Li
         video_id = response.get('id')
         
         if video_id:
-            logger.info(f"Video uploaded successfully! Video ID: {video_id}")
-            logger.info(f"Scheduled for: {schedule_time.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+            logger.info("Video uploaded successfully! Video ID: %s", video_id)
+            logger.info("Scheduled for: %s", schedule_time.strftime('%Y-%m-%dT%H:%M:%SZ'))
+            # The channel's schedule just changed, so don't serve it from cache
+            schedule_config.invalidate_schedule_cache()
             return video_id
         else:
             logger.error("Failed to get video ID from upload response")
             return None
             
     except Exception as e:
-        logger.error(f"Error uploading video: {str(e)}")
+        logger.error("Error uploading video: %s", e)
         return None
 
 def upload_shorts():
@@ -309,7 +311,7 @@ def upload_shorts():
         # Get all shorts in the output directory
         shorts_dir = output_folder / 'shorts'
         if not shorts_dir.exists():
-            logger.error(f"No shorts directory found at {shorts_dir}")
+            logger.error("No shorts directory found at %s", shorts_dir)
             return
         
         # Get all mp4 files
@@ -323,7 +325,7 @@ def upload_shorts():
         if not titles_data:
             logger.warning("No metadata found. Will use default titles and descriptions.")
         
-        logger.info(f"\nFound {len(shorts)} shorts to upload")
+        logger.info("\nFound %s shorts to upload", len(shorts))
         
         # Prepare video metadata for scheduling
         video_metadata = []
@@ -391,7 +393,7 @@ def upload_shorts():
                 tags = schedule_item['metadata']['tags']
                 schedule_time = schedule_item['scheduled_time']
                 
-                logger.info(f"\nUploading video: {title}")
+                logger.info("\nUploading video: %s", title)
                 
                 # Upload with schedule
                 video_id = upload_with_schedule(
@@ -404,29 +406,29 @@ def upload_shorts():
                 )
                 
                 if video_id:
-                    logger.info(f"Video uploaded successfully! Video ID: {video_id}")
-                    logger.info(f"Scheduled for: {schedule_time.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+                    logger.info("Video uploaded successfully! Video ID: %s", video_id)
+                    logger.info("Scheduled for: %s", schedule_time.strftime('%Y-%m-%dT%H:%M:%SZ'))
                     update_upload_status(video_path, video_id)
                     # Update the schedule item with the video ID
                     schedule_item['metadata']['youtube_id'] = video_id
                     successful_uploads += 1
                 else:
-                    logger.error(f"Failed to upload {Path(video_path).name}")
+                    logger.error("Failed to upload %s", Path(video_path).name)
                     failed_uploads += 1
                     
             except Exception as e:
-                logger.error(f"Error uploading {Path(video_path).name}: {str(e)}")
+                logger.error("Error uploading %s: %s", Path(video_path).name, e)
                 failed_uploads += 1
                 
         # After all uploads are complete, display final schedule with video IDs
         logger.info("\n📅  Final Schedule:")
         for schedule_item in schedules:
             video_id = schedule_item['metadata'].get('youtube_id', 'Not uploaded yet')
-            logger.info(f"📤  \"{schedule_item['title']}\" → {schedule_item['scheduled_time'].strftime('%Y-%m-%d %H:%M')} {schedule_config.timezone.zone} [ID: {video_id}]")
+            logger.info("📤  \"%s\" → %s %s [ID: %s]", schedule_item['title'], schedule_item['scheduled_time'].strftime('%Y-%m-%d %H:%M'), schedule_config.timezone.key, video_id)
 
-        logger.info(f"\nUpload Summary:")
-        logger.info(f"Successfully uploaded: {successful_uploads}")
-        logger.info(f"Failed uploads: {failed_uploads}")
+        logger.info("\nUpload Summary:")
+        logger.info("Successfully uploaded: %s", successful_uploads)
+        logger.info("Failed uploads: %s", failed_uploads)
         
         # Load and display final metadata from shorts_titles.json
         try:
@@ -441,18 +443,18 @@ def upload_shorts():
                         video_id = info.get('youtube_id', 'Unknown')
                         title = info.get('title', 'No title')
                         upload_date = info.get('upload_date', 'Unknown')
-                        logger.info(f"🎥  Video ID: {video_id}")
-                        logger.info(f"📝  Title: {title}")
-                        logger.info(f"📅  Upload Date: {upload_date}")
+                        logger.info("🎥  Video ID: %s", video_id)
+                        logger.info("📝  Title: %s", title)
+                        logger.info("📅  Upload Date: %s", upload_date)
                         logger.info("---")
         except Exception as e:
-            logger.error(f"Error reading final metadata: {str(e)}")
+            logger.error("Error reading final metadata: %s", e)
         
         # Add completion message after metadata summary
         logger.info("✅  Completed: Step 4: Upload shorts and schedule")
         
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}")
+        logger.error("An error occurred: %s", e)
 
 if __name__ == "__main__":
     upload_shorts() 
\ No newline at end of file
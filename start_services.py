@@ -32,7 +32,7 @@ class ServiceManager:
         
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
-        logger.info(f"🛑 Received signal {signum}, shutting down services...")
+        logger.info("🛑 Received signal %s, shutting down services...", signum)
         self.running = False
         self.shutdown()
         
@@ -40,7 +40,7 @@ class ServiceManager:
         """Shutdown all managed processes"""
         for process in self.processes:
             if process.poll() is None:  # Process is still running
-                logger.info(f"🛑 Terminating process {process.pid}")
+                logger.info("🛑 Terminating process %s", process.pid)
                 process.terminate()
                 
         # Wait for processes to terminate
@@ -48,7 +48,7 @@ class ServiceManager:
             try:
                 process.wait(timeout=10)
             except subprocess.TimeoutExpired:
-                logger.warning(f"⚠️ Force killing process {process.pid}")
+                logger.warning("⚠️ Force killing process %s", process.pid)
                 process.kill()
                 
     def start_redis(self):
@@ -79,9 +79,9 @@ class ServiceManager:
             logger.warning("⚠️ Redis server not found - make sure Redis is installed")
             return None
             
-    def start_celery_worker(self):
-        """Start Celery worker"""
-        logger.info("🚀 Starting Celery worker...")
+    def start_celery_worker(self, queue='video'):
+        """Start a Celery worker for the 'video' or 'cleanup' queue"""
+        logger.info("🚀 Starting Celery %s worker...", queue)
         
         # Set environment variables
         env = os.environ.copy()
@@ -93,27 +93,39 @@ class ServiceManager:
             '-A', 'celery_app',
             'worker',
             '--loglevel=info',
-            '--concurrency=1',
-            '--pool=solo',
+            '-Q', queue,
+            '-n', f'{queue}@%h',
             '--without-gossip',
             '--without-mingle',
             '--without-heartbeat'
         ]
         
-        # Add additional options for Hostinger KVM 2 deployment
-        cmd.extend([
-            '--max-tasks-per-child=1',
-            '--time-limit=1800',
-            '--soft-time-limit=1500'
-        ])
-        logger.info("🖥️ Hostinger KVM 2 deployment - using optimized settings")
+        if queue == 'video':
+            # Add additional options for Hostinger KVM 2 deployment
+            cmd.extend([
+                '--concurrency=1',
+                '--pool=solo',
+                '--prefetch-multiplier=1',
+                '-O', 'fair',
+                '--max-tasks-per-child=1',
+                '--time-limit=1800',
+                '--soft-time-limit=1500'
+            ])
+            logger.info("🖥️ Hostinger KVM 2 deployment - using optimized settings")
+        else:
+            # Cleanup tasks are short blocking filesystem calls, so a few real threads are enough
+            cmd.extend([
+                '--concurrency=4',
+                '--pool=threads',
+                '--prefetch-multiplier=4'
+            ])
         
         try:
             process = subprocess.Popen(cmd, env=env)
-            logger.info(f"✅ Celery worker started with PID {process.pid}")
+            logger.info("✅ Celery %s worker started with PID %s", queue, process.pid)
             return process
         except Exception as e:
-            logger.error(f"❌ Failed to start Celery worker: {str(e)}")
+            logger.error("❌ Failed to start Celery %s worker: %s", queue, e)
             return None
             
     def start_flask_app(self):
@@ -125,11 +137,12 @@ class ServiceManager:
         env['PYTHONPATH'] = str(project_root)
         
         try:
-            process = subprocess.Popen([sys.executable, 'app.py'], env=env)
-            logger.info(f"✅ Flask app started with PID {process.pid}")
+            # Serve with gunicorn (settings in gunicorn.conf.py) instead of the Flask dev server
+            process = subprocess.Popen([sys.executable, '-m', 'gunicorn', 'app:app'], env=env)
+            logger.info("✅ Flask app started with PID %s", process.pid)
             return process
         except Exception as e:
-            logger.error(f"❌ Failed to start Flask app: {str(e)}")
+            logger.error("❌ Failed to start Flask app: %s", e)
             return None
             
     def run(self):
@@ -146,13 +159,14 @@ class ServiceManager:
         if redis_process:
             self.add_process(redis_process)
             
-        # Start Celery worker
-        celery_process = self.start_celery_worker()
-        if celery_process:
-            self.add_process(celery_process)
-        else:
-            logger.error("❌ Failed to start Celery worker - exiting")
-            return
+        # Start Celery workers (long video jobs and quick cleanups use separate queues)
+        for queue in ('video', 'cleanup'):
+            celery_process = self.start_celery_worker(queue)
+            if celery_process:
+                self.add_process(celery_process)
+            else:
+                logger.error("❌ Failed to start Celery worker - exiting")
+                return
             
         # Start Flask app
         flask_process = self.start_flask_app()
@@ -173,7 +187,7 @@ class ServiceManager:
                 # Check if any process has died
                 for i, process in enumerate(self.processes):
                     if process.poll() is not None:
-                        logger.error(f"❌ Process {process.pid} has died")
+                        logger.error("❌ Process %s has died", process.pid)
                         self.running = False
                         break
                         
@@ -14,6 +14,8 @@ project_root = Path(__file__).parent.absolute()
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from config.paths import get_config_paths
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,7 +26,7 @@ def validate_environment():
     
     # Check for Redis connection
     redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
-    logger.info(f"📡 Redis URL: {redis_url}")
+    logger.info("📡 Redis URL: %s", redis_url)
     
     # Check for required environment variables
     required_env_vars = ['PORT']
@@ -35,35 +37,14 @@ def validate_environment():
             missing_vars.append(var)
     
     if missing_vars:
-        logger.warning(f"⚠️ Missing environment variables: {missing_vars}")
+        logger.warning("⚠️ Missing environment variables: %s", missing_vars)
     
-    # Get paths from config
-    try:
-        import json
-        config_path = Path(__file__).parent / "config" / "master_config.json"
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        input_folder = config.get('input_folder', './input')
-        output_folder = config.get('output_folder', './output')
-        
-        # Use Hostinger KVM 2 paths
-        input_folder = '/opt/video-automation/input'
-        output_folder = '/opt/video-automation/output'
-        logger.info("🖥️ Running on Hostinger KVM 2 - using Hostinger paths")
-        
-        # Create directories
-        Path(input_folder).mkdir(parents=True, exist_ok=True)
-        Path(output_folder).mkdir(parents=True, exist_ok=True)
-        logger.info(f"✅ Input directory ready: {input_folder}")
-        logger.info(f"✅ Output directory ready: {output_folder}")
-        
-    except Exception as e:
-        logger.warning(f"⚠️ Could not read config, using default paths: {str(e)}")
-        # Use Hostinger KVM 2 default paths
-        Path('/opt/video-automation/input').mkdir(parents=True, exist_ok=True)
-        Path('/opt/video-automation/output').mkdir(parents=True, exist_ok=True)
-        logger.info("✅ Created Hostinger KVM 2 directories")
+    # Same folders the web app and the tasks use
+    input_folder, output_folder = get_config_paths()
+    Path(input_folder).mkdir(parents=True, exist_ok=True)
+    Path(output_folder).mkdir(parents=True, exist_ok=True)
+    logger.info("✅ Input directory ready: %s", input_folder)
+    logger.info("✅ Output directory ready: %s", output_folder)
     
     # Check for ffmpeg availability
     try:
@@ -98,51 +79,72 @@ def validate_environment():
     
     logger.info("🔍 Environment validation complete")
 
-def start_celery_worker():
-    """Start the Celery worker"""
-    logger.info("🚀 Starting Celery worker...")
-    
-    # Set environment variables for Celery
-    env = os.environ.copy()
-    env['PYTHONPATH'] = str(project_root)
-    
-    # Celery worker command
+def build_worker_command(queue):
+    """Build the Celery worker command for the 'video' or 'cleanup' queue"""
     cmd = [
         'celery',
         '-A', 'celery_app',
         'worker',
         '--loglevel=info',
-        '--concurrency=1',  # Single worker to avoid conflicts
-        '--pool=solo',      # Use solo pool for better compatibility
+        '-Q', queue,
+        '-n', f'{queue}@%h',
         '--without-gossip',
         '--without-mingle',
         '--without-heartbeat'
     ]
     
-    # Add additional options for Hostinger KVM 2 deployment
-    cmd.extend([
-        '--max-tasks-per-child=1',  # Restart worker after each task
-        '--time-limit=1800',        # 30 minute time limit
-        '--soft-time-limit=1500'    # 25 minute soft limit
-    ])
-    logger.info("🖥️ Hostinger KVM 2 deployment - using optimized settings")
+    if queue == 'video':
+        # Add additional options for Hostinger KVM 2 deployment
+        cmd.extend([
+            '--concurrency=1',          # Single worker to avoid conflicts
+            '--pool=solo',              # Use solo pool for better compatibility
+            '--prefetch-multiplier=1',  # Don't reserve a second 30-minute job
+            '-O', 'fair',
+            '--max-tasks-per-child=1',  # Restart worker after each task
+            '--time-limit=1800',        # 30 minute time limit
+            '--soft-time-limit=1500'    # 25 minute soft limit
+        ])
+    else:
+        # Cleanup tasks are short blocking filesystem calls (scandir/unlink); a few real
+        # threads run them in parallel without monkey-patching, and a small prefetch keeps them fed
+        cmd.extend([
+            '--concurrency=4',
+            '--pool=threads',
+            '--prefetch-multiplier=4'
+        ])
+    return cmd
+
+def start_celery_worker():
+    """Start the Celery workers for the video and cleanup queues"""
+    logger.info("🚀 Starting Celery workers...")
     
-    logger.info(f"📡 Starting worker with command: {' '.join(cmd)}")
+    # Set environment variables for Celery
+    env = os.environ.copy()
+    env['PYTHONPATH'] = str(project_root)
+    
+    logger.info("🖥️ Hostinger KVM 2 deployment - using optimized settings")
     
+    processes = []
     try:
-        # Start the worker process
-        process = subprocess.Popen(cmd, env=env)
+        for queue in ('video', 'cleanup'):
+            cmd = build_worker_command(queue)
+            logger.info("📡 Starting %s worker with command: %s", queue, ' '.join(cmd))
+            processes.append(subprocess.Popen(cmd, env=env))
         
-        # Wait for the process
-        process.wait()
+        # Wait for the processes
+        for process in processes:
+            process.wait()
         
     except KeyboardInterrupt:
-        logger.info("🛑 Received interrupt signal, shutting down worker...")
-        if 'process' in locals():
+        logger.info("🛑 Received interrupt signal, shutting down workers...")
+        for process in processes:
             process.terminate()
+        for process in processes:
             process.wait()
     except Exception as e:
-        logger.error(f"❌ Error starting Celery worker: {str(e)}")
+        logger.error("❌ Error starting Celery worker: %s", e)
+        for process in processes:
+            process.terminate()
         sys.exit(1)
 
 def main():